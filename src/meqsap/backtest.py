@@ -10,12 +10,18 @@ from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 from datetime import date
+import math
+import threading
 import warnings
 import logging
 
 # Set up a logger for debugging
 logger = logging.getLogger(__name__)
 
+# warnings.catch_warnings() swaps the process-wide filter list and is not thread-safe,
+# so backtests running on optimizer worker threads take turns inside it
+_WARNINGS_LOCK = threading.Lock()
+
 # Suppress pandas_ta pkg_resources deprecation warning
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated as an API", category=UserWarning)
 
@@ -34,13 +40,17 @@ from pydantic import BaseModel, Field
 try:
     # For direct imports when used as a package
     from .config import StrategyConfig, BaseStrategyParams
-    from .exceptions import BacktestError
+    from .exceptions import BacktestError, BacktestAborted
     from .indicators_core.registry import get_indicator_registry # New import
     # Import indicators_core to trigger indicator registration
     from . import indicators_core
 except ImportError: # For imports when running tests or if structure changes
     from src.meqsap.config import StrategyConfig, BaseStrategyParams # type: ignore
-    from src.meqsap.exceptions import BacktestError # type: ignore
+    from src.meqsap.exceptions import BacktestError, BacktestAborted # type: ignore
+
+TRADING_DAYS_PER_YEAR = 252
+ANNUALIZATION_FACTOR = np.sqrt(TRADING_DAYS_PER_YEAR)  # Scales daily volatility to annual
+DAYS_PER_YEAR = 365.25  # Calendar days, accounting for leap years
 
 
 class BacktestResult(BaseModel):
@@ -306,8 +316,8 @@ def safe_float(value, default=0.0, metric_name: Optional[str] = None, raise_on_t
         return default
     try:
         result = float(value)
-        # Check for NaN and infinite values
-        if np.isnan(result) or np.isinf(result):
+        # Check for NaN and infinite values (math.isfinite avoids numpy ufunc dispatch on a scalar)
+        if not math.isfinite(result):
             logger.warning(f"Value '{value}'{metric_log_name} converted to NaN or inf, using default: {default}")
             return default
         return result
@@ -328,7 +338,8 @@ def run_backtest(
     prices_data: pd.DataFrame,
     signals_data: pd.DataFrame,
     initial_cash: int = 10000,
-    fees: float = 0.001
+    fees: float = 0.001,
+    include_details: bool = True
 ) -> BacktestResult:
     """Run a backtest with the given price data and signals.
 
@@ -338,6 +349,8 @@ def run_backtest(
         signals_data: DataFrame with 'entry' and 'exit' boolean columns. Index must be datetime and align with prices_data.
         initial_cash: Starting portfolio value (default: 10000).
         fees: Transaction costs as a decimal (default: 0.001 = 0.1%).
+        include_details: Whether to build the per-trade details and portfolio value series.
+                         Runs that only need the summary metrics can skip them (default: True).
 
     Returns:
         BacktestResult object with performance metrics
@@ -417,7 +430,7 @@ def run_backtest(
         logger.debug(f"Exit signals sum: {exits.sum()}")
 
         # Suppress vectorbt warnings
-        with warnings.catch_warnings():
+        with _WARNINGS_LOCK, warnings.catch_warnings():
             warnings.simplefilter("ignore")
             
             logger.debug("Creating vectorbt portfolio...")
@@ -501,7 +514,7 @@ def run_backtest(
         # Use the total return and the period to annualize
         try:
             period_days = (returns.index[-1] - returns.index[0]).days if len(returns) > 1 else 365
-            years = period_days / 365.25  # Account for leap years
+            years = period_days / DAYS_PER_YEAR
             if years > 0 and total_return != 0:
                 annualized_return = ((1 + total_return / 100) ** (1 / years) - 1) * 100
             else:
@@ -598,10 +611,11 @@ def run_backtest(
             
             # Calculate trade duration statistics
             try:
-                trades[entry_time_col] = pd.to_datetime(trades[entry_time_col])
-                trades[exit_time_col] = pd.to_datetime(trades[exit_time_col])
-                trade_durations = (trades[exit_time_col] - trades[entry_time_col]).dt.days
-                avg_trade_duration_days = trade_durations.mean()
+                # Whole days on raw datetime64 arrays, flooring like Timedelta.days
+                entry_times = pd.to_datetime(trades[entry_time_col]).to_numpy(dtype='datetime64[ns]')
+                exit_times = pd.to_datetime(trades[exit_time_col]).to_numpy(dtype='datetime64[ns]')
+                trade_durations = (exit_times - entry_times) // np.timedelta64(1, 'D')
+                avg_trade_duration_days = float(trade_durations.mean())
                 trade_durations_list = trade_durations.tolist()
                 logger.debug(f"Trade duration stats: avg={avg_trade_duration_days:.2f} days")
             except Exception as e:
@@ -617,9 +631,9 @@ def run_backtest(
         
         # Calculate volatility
         try:
-            volatility = float(returns.std() * np.sqrt(252) * 100)  # Annualized volatility
-            # If returns is a Series (due to column selection), returns.std() is a float.
-            # The float() call is redundant but harmless.
+            # Sample std on the raw array, skipping NaNs like Series.std() but without the pandas overhead
+            returns_array = np.asarray(returns, dtype=np.float64)
+            volatility = float(np.nanstd(returns_array, ddof=1) * ANNUALIZATION_FACTOR * 100)  # Annualized volatility
             logger.debug(f"Volatility: {volatility}") # type: ignore
 
         except (ValueError, TypeError) as e:
@@ -632,13 +646,28 @@ def run_backtest(
           # Extract trade details
         logger.debug("Extracting trade details...")
         trade_details = []
-        if len(trades) > 0:
+        if include_details and len(trades) > 0:
+            # Convert timestamps to strings once per column rather than once per trade
+            def format_dates(column: str) -> pd.Series:
+                """Format a timestamp column as YYYY-MM-DD strings.
+
+                Missing values become 'N/A'; unparseable values, or every row when the
+                column is absent, become None so the trade is skipped below.
+                """
+                if column not in trades.columns:
+                    return pd.Series(None, index=trades.index, dtype=object)
+                raw = trades[column]
+                parsed = pd.to_datetime(raw, errors='coerce')
+                formatted = parsed.dt.strftime('%Y-%m-%d').astype(object).where(parsed.notna(), None)
+                return formatted.mask(raw.isna(), 'N/A')
+
+            entry_date_strs = format_dates(entry_time_col)
+            exit_date_strs = format_dates(exit_time_col)
             for idx, trade in trades.iterrows():
                 try:
-                    # Convert timestamps to strings properly
-                    entry_date_str = pd.to_datetime(trade[entry_time_col]).strftime('%Y-%m-%d') if pd.notna(trade[entry_time_col]) else 'N/A'
-                    exit_date_str = pd.to_datetime(trade[exit_time_col]).strftime('%Y-%m-%d') if pd.notna(trade[exit_time_col]) else 'N/A'
-                    
+                    entry_date_str, exit_date_str = entry_date_strs[idx], exit_date_strs[idx]
+                    if entry_date_str is None or exit_date_str is None:
+                        raise ValueError("missing or unparseable trade timestamp")
                     trade_details.append({
                         'entry_date': entry_date_str,
                         'exit_date': exit_date_str,
@@ -652,27 +681,29 @@ def run_backtest(
                     continue
         
         # Extract portfolio value series
-        logger.debug("Extracting portfolio values...")
-        try:
-            portfolio_values = portfolio.value()
-            # Ensure portfolio_values is iterable (Series or DataFrame)
-            if not hasattr(portfolio_values, 'items') and not isinstance(portfolio_values, (pd.Series, pd.DataFrame)):
-                raise BacktestError(f"Portfolio values are not in an iterable format (Series/DataFrame). Got: {type(portfolio_values)}")
-
-            if isinstance(portfolio_values, pd.Series):
-                portfolio_value_series = {str(idx): safe_float(val) for idx, val in portfolio_values.items()}
-            elif isinstance(portfolio_values, pd.DataFrame):
-                # Use the first column if DataFrame
-                series_data = portfolio_values.iloc[:, 0]
-                portfolio_value_series = {str(idx): safe_float(val) for idx, val in series_data.items()}
-            else:
-                # This case should ideally not be hit if portfolio.value() behaves as expected
-                logger.warning(f"Unexpected type for portfolio_values: {type(portfolio_values)}. Attempting direct iteration.")
-                portfolio_value_series = {str(k): safe_float(v, metric_name=f"Portfolio Value ({k})", raise_on_type_error=True) for k, v in getattr(portfolio_values, 'items', lambda: {} )()}
-            logger.debug(f"Portfolio values extracted: {len(portfolio_value_series)} entries")
-        except Exception as e:
-            logger.warning(f"Error extracting portfolio values: {str(e)}")
-            portfolio_value_series = {}
+        portfolio_value_series = {}
+        if include_details:
+            logger.debug("Extracting portfolio values...")
+            try:
+                portfolio_values = portfolio.value()
+                # Ensure portfolio_values is iterable (Series or DataFrame)
+                if not hasattr(portfolio_values, 'items') and not isinstance(portfolio_values, (pd.Series, pd.DataFrame)):
+                    raise BacktestError(f"Portfolio values are not in an iterable format (Series/DataFrame). Got: {type(portfolio_values)}")
+
+                if isinstance(portfolio_values, pd.Series):
+                    portfolio_value_series = {str(idx): safe_float(val) for idx, val in portfolio_values.items()}
+                elif isinstance(portfolio_values, pd.DataFrame):
+                    # Use the first column if DataFrame
+                    series_data = portfolio_values.iloc[:, 0]
+                    portfolio_value_series = {str(idx): safe_float(val) for idx, val in series_data.items()}
+                else:
+                    # This case should ideally not be hit if portfolio.value() behaves as expected
+                    logger.warning(f"Unexpected type for portfolio_values: {type(portfolio_values)}. Attempting direct iteration.")
+                    portfolio_value_series = {str(k): safe_float(v, metric_name=f"Portfolio Value ({k})", raise_on_type_error=True) for k, v in getattr(portfolio_values, 'items', lambda: {} )()}
+                logger.debug(f"Portfolio values extracted: {len(portfolio_value_series)} entries")
+            except Exception as e:
+                logger.warning(f"Error extracting portfolio values: {str(e)}")
+                portfolio_value_series = {}
         
         logger.debug("Creating BacktestResult...")
         result = BacktestResult(
@@ -768,7 +799,8 @@ def perform_vibe_checks(
 def perform_robustness_checks(
     data: pd.DataFrame, 
     signals: pd.DataFrame, 
-    strategy_config: StrategyConfig
+    strategy_config: StrategyConfig,
+    baseline_result: Optional[BacktestResult] = None
 ) -> RobustnessResults:
     """Perform robustness analysis on the strategy.
     
@@ -776,18 +808,22 @@ def perform_robustness_checks(
         data: Market data DataFrame
         signals: Generated signals DataFrame
         strategy_config: Strategy configuration
+        baseline_result: Existing backtest of these signals at the baseline 0.1% fee;
+            it is run here when omitted
         
     Returns:
         RobustnessResults with sensitivity analysis
     """
     try:
         # Baseline backtest (low fees)
-        baseline_result = run_backtest(prices_data=data, signals_data=signals, fees=0.001)  # 0.1%
+        if baseline_result is None:
+            baseline_result = run_backtest(prices_data=data, signals_data=signals, fees=0.001)  # 0.1%
         baseline_sharpe = baseline_result.sharpe_ratio
         baseline_return = baseline_result.annualized_return
         
         # High fees backtest
-        high_fees_result = run_backtest(prices_data=data, signals_data=signals, fees=0.01)  # 1.0%
+        high_fees_result = run_backtest(prices_data=data, signals_data=signals, fees=0.01,
+                                        include_details=False)  # 1.0%; only its metrics are compared
         high_fees_sharpe = high_fees_result.sharpe_ratio
         high_fees_return = high_fees_result.annualized_return
         
@@ -839,8 +875,13 @@ def perform_robustness_checks(
         )
 
 
-def run_complete_backtest(strategy_config, data, objective_params=None):
-    """Execute complete backtest analysis including validation and robustness checks."""
+def run_complete_backtest(strategy_config, data, objective_params=None, on_primary_result=None):
+    """Execute complete backtest analysis including validation and robustness checks.
+
+    ``on_primary_result``, if given, is called with the primary BacktestResult before the
+    vibe and robustness checks run. It may raise BacktestAborted to skip them; that
+    exception propagates unwrapped.
+    """
     logger.debug(f"Starting complete backtest for ticker: {strategy_config.ticker}")
     try:
         if isinstance(data, dict):
@@ -861,22 +902,27 @@ def run_complete_backtest(strategy_config, data, objective_params=None):
             min_hold = objective_params.get('min_hold_days')
             max_hold = objective_params.get('max_hold_days')
             if min_hold is not None and max_hold is not None:
-                in_range_count = sum(1 for d in primary_result.trade_durations_days if min_hold <= d <= max_hold)
+                durations = np.asarray(primary_result.trade_durations_days)
+                in_range_count = np.count_nonzero((durations >= min_hold) & (durations <= max_hold))
                 if primary_result.total_trades > 0:
                     primary_result.pct_trades_in_target_hold_period = (in_range_count / primary_result.total_trades) * 100
                 else:
                     primary_result.pct_trades_in_target_hold_period = 0.0
 
+        if on_primary_result is not None:
+            on_primary_result(primary_result)
+
         # Step 3: Perform vibe checks
         vibe_checks = perform_vibe_checks(primary_result,
                                           actual_prices_df,
                                           strategy_config)
 
-        # Step 4: Perform robustness checks
+        # Step 4: Perform robustness checks (the primary run already is the low-fee baseline)
         robustness_checks = perform_robustness_checks(
             actual_prices_df,
             actual_signals_df,
-            strategy_config)
+            strategy_config,
+            baseline_result=primary_result)
 
         # Step 5: Assemble comprehensive analysis
         return BacktestAnalysisResult(
@@ -885,6 +931,8 @@ def run_complete_backtest(strategy_config, data, objective_params=None):
             robustness_checks=robustness_checks,
             strategy_config=strategy_config.model_dump()
         )
+    except BacktestAborted:
+        raise
     except Exception as e:
         logger.error(f"Complete backtest analysis failed: {str(e)}", exc_info=True)
         raise BacktestError(f"Complete backtest analysis failed: {str(e)}") from e
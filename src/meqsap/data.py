@@ -2,13 +2,11 @@ import os
 import pandas as pd
 import yfinance as yf
 from datetime import date, datetime, timedelta
-from pathlib import Path
 import logging
 from .exceptions import DataError
+from .paths import CACHE_DIR, PROJECT_ROOT
 
 # Cache directory setup
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-CACHE_DIR = PROJECT_ROOT / 'data' / 'cache'
 os.makedirs(CACHE_DIR, exist_ok=True)
 
 logger = logging.getLogger(__name__)
@@ -90,7 +88,7 @@ def _validate_data(data: pd.DataFrame, symbol: str, start_date: str, end_date: s
     if dates.max() < expected_end:
         raise DataError(f"Data ends at {dates.max()}, but data through {expected_end} was requested")
 
-def fetch_market_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+def fetch_market_data(ticker: str, start_date: date, end_date: date, force_refresh: bool = False) -> pd.DataFrame:
     """
     Fetch OHLCV market data for given ticker and date range.
     
@@ -98,6 +96,7 @@ def fetch_market_data(ticker: str, start_date: date, end_date: date) -> pd.DataF
         ticker: Stock ticker symbol
         start_date: Start of date range
         end_date: End of date range
+        force_refresh: Download even if the range is cached, then overwrite the cache entry
         
     Returns:
         pandas.DataFrame with OHLCV data
@@ -105,12 +104,13 @@ def fetch_market_data(ticker: str, start_date: date, end_date: date) -> pd.DataF
     Raises:
         DataError: For any data integrity or download issues
     """
-    try:
-        # Try loading from cache
-        key = cache_key(ticker, start_date, end_date)
-        return load_from_cache(key)
-    except FileNotFoundError:
-        pass  # Cache miss, proceed to download
+    key = cache_key(ticker, start_date, end_date)
+    if not force_refresh:
+        try:
+            # Try loading from cache
+            return load_from_cache(key)
+        except FileNotFoundError:
+            pass  # Cache miss, proceed to download
     
     try:
         # yfinance uses exclusive end dates, so add 1 day to get data for the user-specified end_date
@@ -21,6 +21,11 @@ class BacktestError(MEQSAPError):
     pass
 
 
+class BacktestAborted(MEQSAPError):
+    """Raised by a backtest callback to stop a run before its remaining checks."""
+    pass
+
+
 class ReportingError(MEQSAPError):
     """Errors related to report generation or presentation."""
     pass
@@ -1,32 +1,64 @@
 """Optimization engine with progress tracking and robust error handling."""
 
+import hashlib
+import itertools
+import json
 import logging
+import math
+import os
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, Callable, List
-from collections import defaultdict
+from typing import Dict, Any, Optional, Callable, List, Tuple
 
 import optuna
+import sqlalchemy
 from optuna import Trial
 
-from ..exceptions import DataError, BacktestError, ConfigurationError, OptimizationInterrupted
-from ..backtest import run_complete_backtest, BacktestAnalysisResult
+from ..exceptions import DataError, BacktestError, BacktestAborted, ConfigurationError, OptimizationInterrupted
+from ..backtest import run_complete_backtest, BacktestAnalysisResult, BacktestResult
 from .models import TrialFailureType, ProgressData, ErrorSummary, OptimizationResult
 from ..config import StrategyFactory, StrategyConfig
 
 # Constants
 FAILED_TRIAL_SCORE = -np.inf
+SQLITE_TIMEOUT_SECONDS = 300
+PRIMARY_RESULT_STEP = 1  # Pruning step for the primary backtest; SuccessiveHalving ignores steps below min_resource
+OPTIMIZATION_DIRECTIONS = frozenset({"maximize", "minimize"})
+PROGRESS_MIN_INTERVAL_SECONDS = 0.1  # Progress callbacks fire at most this often, except for the final trials
+RUN_FINGERPRINT_ATTR = "meqsap_run_fingerprint"  # Study user attribute naming the data and scoring setup of its trials
 
 logger = logging.getLogger(__name__)
 
 
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    """Switch a new SQLite connection to WAL journaling.
+
+    WAL lets readers and a writer work concurrently and replaces the per-commit
+    fsync of the rollback journal with periodic checkpoints.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _never_interrupted() -> bool:
+    """Interruption check used when no interruption event is registered."""
+    return False
+
+
 class _ParameterParser:
     """Helper class to parse a single parameter definition for different samplers."""
 
     def __init__(self, name: str, definition: Any):
         self.name = name
         self.definition = definition
+        # Resolve the definition once so each trial only pays for the suggest call itself
+        self._suggest = self._resolve_suggestion()
 
     def for_grid_search(self) -> List[Any]:
         """Returns a list of values for GridSampler."""
@@ -35,7 +67,7 @@ class _ParameterParser:
             if param_type == "range":
                 start, stop, step = self.definition['start'], self.definition['stop'], self.definition['step']
                 if all(isinstance(x, int) for x in [start, stop, step]):
-                    return list(range(start, stop + 1, step))
+                    return np.arange(start, stop + 1, step, dtype=np.int64).tolist()
                 else:
                     num_steps = int(round((stop - start) / step)) + 1
                     return np.linspace(start, stop, num=num_steps).tolist()
@@ -56,24 +88,34 @@ class _ParameterParser:
 
     def for_trial_suggestion(self, trial: Trial) -> Any:
         """Suggests a value for a trial for other samplers."""
+        return self._suggest(trial)
+
+    def _resolve_suggestion(self) -> Callable[[Trial], Any]:
+        """Build the callable that suggests this parameter's value for a trial."""
+        name = self.name
         if isinstance(self.definition, dict):
             param_type = self.definition.get("type")
             if param_type == "range":
                 start, stop, step = self.definition['start'], self.definition['stop'], self.definition['step']
                 if all(float(x).is_integer() for x in [start, stop, step]):
-                    return trial.suggest_int(self.name, int(start), int(stop), step=int(step))
+                    start, stop, step = int(start), int(stop), int(step)
+                    return lambda trial: trial.suggest_int(name, start, stop, step=step)
                 else:
-                    return trial.suggest_float(self.name, float(start), float(stop), step=float(step))
+                    start, stop, step = float(start), float(stop), float(step)
+                    return lambda trial: trial.suggest_float(name, start, stop, step=step)
             elif param_type == "choices":
-                return trial.suggest_categorical(self.name, self.definition['values'])
+                choices = self.definition['values']
+                return lambda trial: trial.suggest_categorical(name, choices)
             elif param_type == "value":
-                return self.definition['value']
+                value = self.definition['value']
+                return lambda trial: value
             else:
                 raise ConfigurationError(
                     f"Unsupported parameter definition type '{param_type}' for trial suggestion on parameter '{self.name}'."
                 )
         elif isinstance(self.definition, (int, float, str, bool)):
-            return self.definition
+            value = self.definition
+            return lambda trial: value
         else:
             raise ConfigurationError(
                 f"Unsupported parameter definition for trial suggestion on parameter '{self.name}': {self.definition}"
@@ -93,10 +135,19 @@ class OptimizationEngine:
             objective_params: Parameters for the objective function
             algorithm_params: Parameters for the optimization algorithm. Supported keys:
                 - n_trials: Default number of trials (overridden by run_optimization param)
-                - sampler: Optuna sampler type ('tpe', 'random', 'grid', 'cmaes')
+                - sampler: Optuna sampler type ('tpe', 'random', 'grid', 'cmaes', 'botorch')
                 - pruner: Optuna pruner type ('median', 'successive_halving', 'hyperband')
+                - pruner_params: Keyword arguments for the pruner (e.g. min_resource, reduction_factor)
                 - random_seed: Random seed for reproducibility
+                - n_startup_trials: Random trials before TPE starts fitting its model (default 10)
+                - n_ei_candidates: Candidates TPE scores per suggestion (default 24)
+                - constant_liar: Let TPE account for in-flight trials (default on when n_jobs > 1)
+                - consider_running_trials: Let BoTorch account for in-flight trials (default True)
+                - n_jobs: Trials evaluated concurrently in worker threads, -1 for one per CPU (default 1)
                 - timeout: Timeout in seconds for optimization
+                - storage: Database URL or journal file path to persist trials (default in-memory)
+                - study_name: Name of a stored study to resume, so earlier trials inform the sampler (requires storage)
+                - progress_interval: Minimum seconds between progress callbacks (default 0.1)
                 - direction: Optimization direction ('maximize' or 'minimize')
         """
         self.strategy_config = strategy_config
@@ -108,48 +159,101 @@ class OptimizationEngine:
         self._progress_callback: Optional[Callable[[ProgressData], None]] = None
         self._total_trials: Optional[int] = None
         self._interruption_event = None
+        self._is_interrupted: Callable[[], bool] = _never_interrupted
         self._market_data = None
         self._start_time: float = 0.0
         self._current_trial: int = 0
         self._successful_trials: int = 0        
         self._best_score: Optional[float] = None
-        self._failed_trials_by_type: Dict[TrialFailureType, int] = defaultdict(int)
+        self._best_trial_number: Optional[int] = None
+        self._best_params: Optional[Dict[str, Any]] = None
+        self._best_analysis: Optional[BacktestAnalysisResult] = None
+        # True when the study was loaded with trials from an earlier run
+        self._resumed_study: bool = False
+        # Validated once here so a bad direction surfaces when the engine is built
+        self._direction: str = self._validate_and_normalize_direction(
+            self.algorithm_params.get("direction", "maximize")
+        )
+        self._n_jobs: int = self._validate_and_normalize_n_jobs(self.algorithm_params.get("n_jobs", 1))
+        # A named study is only resumable from persisted trials
+        if self.algorithm_params.get("study_name") is not None and self.algorithm_params.get("storage") is None:
+            raise ConfigurationError(
+                "study_name requires storage; without it the study would start empty in memory."
+            )
+        self._pruning_enabled: bool = False
+        # Scores of successful trials by parameter values, in parameter definition order
+        self._scores_by_params: Dict[tuple, float] = {}
+        self._failed_trials_by_type: Dict[TrialFailureType, int] = dict.fromkeys(TrialFailureType, 0)
+        # Failure summary handed to progress callbacks; rebuilt only when a failure is recorded
+        self._failure_summary: Dict[str, int] = {}
+        self._last_progress_emit: float = 0.0
+        self._progress_min_interval: float = self.algorithm_params.get("progress_interval", PROGRESS_MIN_INTERVAL_SECONDS)
         self._was_interrupted: bool = False
+        # Trials may run on several threads (n_jobs > 1); guards the counters above
+        self._state_lock = threading.Lock()
+        self._param_parsers: List[_ParameterParser] = [
+            _ParameterParser(param_name, param_def)
+            for param_name, param_def in self.strategy_config.strategy_params.items()
+        ]
+        # Built on first use; the parameter definitions never change after construction
+        self._grid_search_space: Optional[Dict[str, List[Any]]] = None
     
     def _get_grid_search_space(self) -> Dict[str, List[Any]]:
         """
         Returns a search space dictionary suitable for optuna.samplers.GridSampler.
         """
-        search_space = {}
-        strategy_params_dict = self.strategy_config.strategy_params
+        if self._grid_search_space is None:
+            search_space = {parser.name: parser.for_grid_search() for parser in self._param_parsers}
 
-        for param_name, param_def in strategy_params_dict.items():
-            parser = _ParameterParser(param_name, param_def)
-            search_space[param_name] = parser.for_grid_search()
+            if not search_space:
+                raise ConfigurationError("GridSearch requires at least one parameter with a defined search space (range or choices).")
 
-        if not search_space:
-            raise ConfigurationError("GridSearch requires at least one parameter with a defined search space (range or choices).")
+            self._grid_search_space = search_space
+        return self._grid_search_space
 
-        return search_space
+    def _enqueue_feasible_grid(self, study: optuna.Study) -> None:
+        """Queue only the grid points that satisfy the strategy's constraints.
 
-    def _get_grid_constraints_func(self) -> Optional[Callable[[optuna.trial.FrozenTrial], bool]]:
+        GridSampler cannot skip infeasible cells by itself, so when a constraint such as
+        fast_ma < slow_ma rules out part of the grid, the feasible points are enqueued up
+        front and the run is capped at their count instead of spending a pruned trial on
+        every invalid cell. Either way the run never asks for more trials than the grid has.
         """
-        Returns a constraints function for the GridSampler based on the strategy.
-        This is used to prune invalid parameter combinations from the grid.
-        """
-        strategy_type = self.strategy_config.strategy_type
-
-        if strategy_type == "MovingAverageCrossover":
-            def constraints(trial: optuna.trial.FrozenTrial) -> bool:
-                # Prune if fast_ma is not smaller than slow_ma
-                if "fast_ma" in trial.params and "slow_ma" in trial.params:
-                    return trial.params["fast_ma"] < trial.params["slow_ma"]
-                return True  # No constraint to apply if params are missing
-            return constraints
-
-        # Return None if no constraints for this strategy type
-        return None
-    
+        search_space = self._get_grid_search_space()
+        grid_size = math.prod(len(values) for values in search_space.values())
+        self._total_trials = min(self._total_trials, grid_size)
+        # One column of value indices per parameter, in itertools.product order, so the
+        # constraints are evaluated over whole columns and only feasible points become dicts
+        index_columns = np.indices([len(values) for values in search_space.values()]).reshape(len(search_space), -1)
+        value_columns = {
+            name: np.asarray(values)[indices]
+            for (name, values), indices in zip(search_space.items(), index_columns)
+        }
+        feasible = np.ones(index_columns.shape[1], dtype=bool)
+        for constraint_value in self._get_constraint_values(value_columns).values():
+            feasible &= constraint_value <= 0
+        feasible_rows = np.flatnonzero(feasible)
+        if len(feasible_rows) == grid_size:
+            return
+
+        logger.info(f"Grid search: {len(feasible_rows)} of {grid_size} grid points satisfy the strategy constraints")
+        feasible_points = (
+            tuple(values[i] for values, i in zip(search_space.values(), index_columns[:, row].tolist()))
+            for row in feasible_rows
+        )
+        # A resumed study only needs the points it has not finished yet; points are
+        # value tuples in search space order so each lookup is a set membership test
+        finished = {
+            tuple(t.params.get(name) for name in search_space)
+            for t in study.get_trials(deepcopy=False) if t.state.is_finished()
+        }
+        enqueued = 0
+        for point in feasible_points:
+            if point not in finished:
+                study.enqueue_trial(dict(zip(search_space, point)))
+                enqueued += 1
+        self._total_trials = min(self._total_trials, enqueued)
+
     def _get_sampler(self) -> Optional[optuna.samplers.BaseSampler]:
         """Get Optuna sampler based on algorithm parameters.
         
@@ -163,15 +267,51 @@ class OptimizationEngine:
         elif sampler_type == "grid":
             logger.info("Grid sampler requested. Building search space...")
             search_space = self._get_grid_search_space()
-            constraints_func = self._get_grid_constraints_func()
-            return optuna.samplers.GridSampler(search_space, constraints_func=constraints_func)
+            return optuna.samplers.GridSampler(search_space, seed=random_seed)
         elif sampler_type == "cmaes":
             return optuna.samplers.CmaEsSampler(seed=random_seed)
         elif sampler_type == "tpe":
-            return optuna.samplers.TPESampler(seed=random_seed)
+            return self._get_tpe_sampler(random_seed)
+        elif sampler_type == "botorch":
+            return self._get_botorch_sampler(random_seed)
         else:
             logger.warning(f"Unknown sampler type: {sampler_type}, using default TPE")
-            return optuna.samplers.TPESampler(seed=random_seed)
+            return self._get_tpe_sampler(random_seed)
+
+    def _get_tpe_sampler(self, random_seed: Optional[int]) -> optuna.samplers.TPESampler:
+        """Build a TPE sampler from algorithm parameters.
+
+        The model is only fitted after ``n_startup_trials`` random trials, and
+        ``constant_liar`` keeps parallel workers from proposing near-identical
+        points while other trials are still running.
+        """
+        return optuna.samplers.TPESampler(
+            seed=random_seed,
+            n_startup_trials=self.algorithm_params.get("n_startup_trials", 10),
+            n_ei_candidates=self.algorithm_params.get("n_ei_candidates", 24),
+            constant_liar=self.algorithm_params.get("constant_liar", self._n_jobs > 1),
+        )
+
+    def _get_botorch_sampler(self, random_seed: Optional[int]) -> optuna.samplers.BaseSampler:
+        """Build a BoTorch sampler, which needs the optional optuna-integration package.
+
+        ``consider_running_trials`` (default on) conditions suggestions on trials that
+        are still running, so parallel workers explore different points.
+
+        Raises:
+            ConfigurationError: If optuna-integration[botorch] is not installed
+        """
+        try:
+            botorch_sampler_cls = optuna.integration.BoTorchSampler
+        except ImportError as e:
+            raise ConfigurationError(
+                "The 'botorch' sampler requires optuna-integration. "
+                "Install it with: pip install optuna-integration[botorch]"
+            ) from e
+        return botorch_sampler_cls(
+            seed=random_seed,
+            consider_running_trials=self.algorithm_params.get("consider_running_trials", True),
+        )
     
     def _get_pruner(self) -> Optional[optuna.pruners.BasePruner]:
         """Get Optuna pruner based on algorithm parameters.
@@ -184,12 +324,13 @@ class OptimizationEngine:
             return None
             
         pruner_type = pruner_type.lower()
+        pruner_params = self.algorithm_params.get("pruner_params", {})
         if pruner_type == "median":
-            return optuna.pruners.MedianPruner()
+            return optuna.pruners.MedianPruner(**pruner_params)
         elif pruner_type == "successive_halving":
-            return optuna.pruners.SuccessiveHalvingPruner()
+            return optuna.pruners.SuccessiveHalvingPruner(**pruner_params)
         elif pruner_type == "hyperband":
-            return optuna.pruners.HyperbandPruner()        
+            return optuna.pruners.HyperbandPruner(**pruner_params)
         else:
             logger.warning(f"Unknown pruner type: {pruner_type}, using no pruning")
             return None
@@ -211,12 +352,26 @@ class OptimizationEngine:
         
         normalized = direction.strip().lower()
         
-        if normalized not in ("maximize", "minimize"):
+        if normalized not in OPTIMIZATION_DIRECTIONS:
             raise ConfigurationError(
                 f"Invalid optimization direction '{direction}'. Must be 'maximize' or 'minimize'."
             )
         
         return normalized
+
+    def _validate_and_normalize_n_jobs(self, n_jobs: int) -> int:
+        """Validate the worker count, resolving -1 to the number of CPUs as Optuna does.
+
+        Raises:
+            ConfigurationError: If n_jobs is not a positive integer or -1
+        """
+        if isinstance(n_jobs, bool) or not isinstance(n_jobs, int):
+            raise ConfigurationError(f"n_jobs must be an integer, got {type(n_jobs).__name__}")
+        if n_jobs == -1:
+            return os.cpu_count() or 1
+        if n_jobs < 1:
+            raise ConfigurationError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
+        return n_jobs
       
     def run_optimization(self, market_data: pd.DataFrame, progress_callback: Optional[Callable[[ProgressData], None]] = None,
                         interruption_event=None, n_trials: Optional[int] = None) -> OptimizationResult:
@@ -231,38 +386,7 @@ class OptimizationEngine:
         Returns:
             OptimizationResult with best parameters and comprehensive statistics
         """    
-        self._progress_callback = progress_callback
-        self._interruption_event = interruption_event
-        
-        # Use n_trials from parameter or fall back to algorithm_params default
-        effective_n_trials = n_trials if n_trials is not None else self.algorithm_params.get("n_trials", 100)
-        self._total_trials = effective_n_trials
-        self._market_data = market_data
-
-        # Reset state for the new run
-        self._start_time = time.time()
-        self._current_trial = 0
-        self._successful_trials = 0
-        self._best_score = None
-        self._failed_trials_by_type = defaultdict(int)
-        self._was_interrupted = False
-        logger.info(f"Starting optimization with {effective_n_trials} trials")
-        
-        # Configure Optuna study based on algorithm parameters
-        raw_direction = self.algorithm_params.get("direction", "maximize")
-        direction = self._validate_and_normalize_direction(raw_direction)
-        sampler = self._get_sampler()
-        pruner = self._get_pruner()
-        
-        # Create Optuna study with configured parameters
-        storage = "sqlite:///meqsap_trials.db"
-        study = optuna.create_study(
-            direction=direction,
-            storage=storage,
-            study_name=f"meqsap_optimization_{int(time.time())}",
-            sampler=sampler,
-            pruner=pruner
-        )
+        study = self._start_run(market_data, progress_callback, interruption_event, n_trials)
         
         # Set timeout if specified
         timeout = self.algorithm_params.get("timeout")
@@ -283,8 +407,9 @@ class OptimizationEngine:
         def optimize_with_context():
             study.optimize(
                 lambda trial: self._run_single_trial(trial, market_data),
-                n_trials=effective_n_trials,
+                n_trials=self._total_trials,
                 timeout=timeout,
+                n_jobs=self._n_jobs,
                 callbacks=[self._trial_callback] if progress_callback else []
             )
             
@@ -302,7 +427,266 @@ class OptimizationEngine:
         
         # Compile results
         return self._compile_results(study)
+
+    def run_optimization_batched(self, market_data: pd.DataFrame, batch_size: int = 32,
+                                 progress_callback: Optional[Callable[[ProgressData], None]] = None,
+                                 interruption_event=None, n_trials: Optional[int] = None) -> OptimizationResult:
+        """Run optimization with an ask-and-tell loop that evaluates trials in batches.
+
+        Parameters for a whole batch are suggested up front on the calling thread, the
+        backtests then run on a thread pool of ``n_jobs`` workers, and the scores are
+        told back to the study before the next batch is asked for.
+
+        Args:
+            market_data: Market data DataFrame for backtesting
+            batch_size: Number of trials asked from the sampler per batch
+            progress_callback: Callback for progress updates
+            interruption_event: Event for graceful interruption
+            n_trials: Number of trials (overrides algorithm_params default)
+
+        Returns:
+            OptimizationResult with best parameters and comprehensive statistics
+        """
+        if batch_size < 1:
+            raise ConfigurationError(f"batch_size must be at least 1, got {batch_size}")
+
+        study = self._start_run(market_data, progress_callback, interruption_event, n_trials)
+        timeout = self.algorithm_params.get("timeout")
+        remaining = self._total_trials
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._n_jobs) as executor:
+                while remaining > 0:
+                    if self._is_interrupted():
+                        self._was_interrupted = True
+                        break
+                    if timeout is not None and time.monotonic() - self._start_time >= timeout:
+                        break
+
+                    batch_n = min(batch_size, remaining)
+                    if timeout is not None:
+                        batch_n = min(batch_n, self._trials_before_deadline(timeout))
+                    remaining -= batch_n
+                    batch = []
+                    for _ in range(batch_n):
+                        trial = study.ask()
+                        try:
+                            batch.append((trial, self._begin_trial(trial)))
+                        except optuna.TrialPruned:
+                            study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+
+                    # _evaluate_trial classifies its own failures, so every future yields an outcome
+                    outcomes = executor.map(
+                        lambda item: self._evaluate_trial_for_tell(item[0], item[1], market_data), batch
+                    )
+                    for (trial, _), (score, state) in zip(batch, outcomes):
+                        study.tell(trial, score, state=state)
+        except KeyboardInterrupt:
+            self._was_interrupted = True
+            logger.info("Optimization interrupted by user")
+        except Exception as e:
+            logger.error(f"Optimization failed with error: {e}", exc_info=True)
+
+        return self._compile_results(study)
+
+    def _trials_before_deadline(self, timeout: float) -> int:
+        """Estimate how many more trials fit in the time left before ``timeout``.
+
+        Until a trial has finished there is no timing to go on, so one trial per worker
+        is allowed. At least one trial is always allowed while the deadline has not passed.
+        """
+        elapsed = time.monotonic() - self._start_time
+        if self._current_trial == 0 or elapsed <= 0:
+            return self._n_jobs
+        avg_per_trial = elapsed / self._current_trial
+        return max(1, int((timeout - elapsed) / avg_per_trial))
+
+    def _evaluate_trial_for_tell(self, trial: Trial, concrete_params: Dict[str, Any],
+                                 market_data) -> Tuple[Optional[float], optuna.trial.TrialState]:
+        """Evaluate a trial and return the value and state to tell the study."""
+        try:
+            return self._evaluate_trial(trial, concrete_params, market_data), optuna.trial.TrialState.COMPLETE
+        except optuna.TrialPruned:
+            return None, optuna.trial.TrialState.PRUNED
+
+    def _start_run(self, market_data: pd.DataFrame, progress_callback: Optional[Callable[[ProgressData], None]],
+                   interruption_event, n_trials: Optional[int]) -> optuna.Study:
+        """Reset run state, warm up the backtester and create the Optuna study.
+
+        Returns:
+            A fresh study configured from the algorithm parameters
+        """
+        self._progress_callback = progress_callback
+        self._interruption_event = interruption_event
+        # Bound once so the per-trial check is a single call
+        self._is_interrupted = interruption_event.is_set if interruption_event is not None else _never_interrupted
+        
+        # Use n_trials from parameter or fall back to algorithm_params default
+        effective_n_trials = n_trials if n_trials is not None else self.algorithm_params.get("n_trials", 100)
+        self._total_trials = effective_n_trials
+        self._market_data = market_data
+
+        # Pay the one-off JIT compilation cost before the clock starts
+        self._warm_up_backtest(market_data)
+
+        # Reset state for the new run
+        self._start_time = time.monotonic()
+        self._current_trial = 0
+        self._successful_trials = 0
+        self._best_score = None
+        self._best_trial_number = None
+        self._best_params = None
+        self._best_analysis = None
+        self._scores_by_params = {}
+        self._failed_trials_by_type = dict.fromkeys(TrialFailureType, 0)
+        self._failure_summary = {}
+        self._last_progress_emit = 0.0
+        self._was_interrupted = False
+        
+        # Configure Optuna study based on algorithm parameters
+        sampler = self._get_sampler()
+        pruner = self._get_pruner()
+        self._pruning_enabled = pruner is not None
+        
+        # Create Optuna study with configured parameters; a named study resumes its stored trials
+        study_name = self.algorithm_params.get("study_name")
+        study = optuna.create_study(
+            direction=self._direction,
+            storage=self._create_storage(),
+            study_name=study_name or f"meqsap_optimization_{uuid.uuid4().hex}",
+            sampler=sampler,
+            pruner=pruner,
+            load_if_exists=study_name is not None
+        )
+        # Stored scores are only comparable when they were computed on the same data and objective
+        self._resumed_study = False
+        if study_name is not None:
+            fingerprint = self._run_fingerprint(market_data)
+            if not study.trials:
+                study.set_user_attr(RUN_FINGERPRINT_ATTR, fingerprint)
+            elif study.user_attrs.get(RUN_FINGERPRINT_ATTR) == fingerprint:
+                self._resumed_study = True
+                logger.info(f"Resuming study '{study_name}' with {len(study.trials)} stored trials")
+                self._seed_scores_from_study(study)
+            else:
+                logger.warning(f"Study '{study_name}' was not recorded with the current data and objective "
+                               f"settings; its {len(study.trials)} stored scores are not reused")
+        if isinstance(sampler, optuna.samplers.GridSampler):
+            self._enqueue_feasible_grid(study)
+        logger.info(f"Starting optimization with {self._total_trials} trials")
+        return study
     
+    def _run_fingerprint(self, market_data: Optional[pd.DataFrame]) -> str:
+        """Digest of everything besides the parameters that a trial's score depends on.
+
+        Covers the market data (index and values), the objective function and its
+        parameters, the direction and the non-parameter strategy settings.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        if market_data is not None:
+            digest.update(pd.util.hash_pandas_object(market_data, index=True).to_numpy().tobytes())
+        objective = self.objective_function
+        settings = {
+            "objective": f"{getattr(objective, '__module__', '')}.{getattr(objective, '__qualname__', type(objective).__qualname__)}",
+            "objective_params": self.objective_params,
+            "direction": self._direction,
+            "strategy": self.strategy_config.model_dump(mode="json", exclude={"strategy_params", "optimization_config"}),
+        }
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _seed_scores_from_study(self, study: optuna.Study) -> None:
+        """Reuse the scores of a resumed study's successful trials for repeated combinations.
+
+        The stored trials only hold the suggested values, so each is replayed through the
+        parameter parsers to recover the full parameter set used as the cache key. Trials
+        whose values no longer fit the current definitions are skipped.
+        """
+        for stored in study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,)):
+            if stored.value is None or stored.value == FAILED_TRIAL_SCORE:
+                continue
+            try:
+                params = self._replay_params(stored.params)
+            except ValueError:
+                continue
+            self._scores_by_params[tuple(params.values())] = stored.value
+        logger.debug("Seeded %d cached scores from the resumed study", len(self._scores_by_params))
+
+    def _replay_params(self, stored_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the full parameter set, fixed values included, from a stored trial's suggestions.
+
+        Raises:
+            ValueError: If the stored values no longer fit the current parameter definitions
+        """
+        replay = optuna.trial.FixedTrial(stored_params)
+        params = {parser.name: parser.for_trial_suggestion(replay) for parser in self._param_parsers}
+        # FixedTrial only warns about values outside a range, so check them against each distribution
+        for name, distribution in replay.distributions.items():
+            if not distribution._contains(distribution.to_internal_repr(replay.params[name])):
+                raise ValueError(f"Stored value {replay.params[name]!r} for '{name}' is outside {distribution}")
+        return params
+
+    def _create_storage(self) -> Optional[optuna.storages.BaseStorage]:
+        """Create the trial storage requested by the ``storage`` algorithm parameter.
+
+        Without it trials stay in memory, which avoids a database round trip on every
+        ask/tell and any lock contention between parallel trials. A database URL
+        (e.g. ``sqlite:///meqsap_trials.db``) persists trials in an RDB, with WAL
+        journaling for SQLite. Any other value is the path of an append-only journal
+        file, which handles many concurrent writers better than SQLite.
+
+        Returns:
+            The configured storage, or None for Optuna's in-memory storage
+        """
+        storage_setting = self.algorithm_params.get("storage")
+        if storage_setting is None:
+            return None
+        if "://" not in storage_setting:
+            return optuna.storages.JournalStorage(optuna.storages.journal.JournalFileBackend(storage_setting))
+        if not storage_setting.startswith("sqlite"):
+            return optuna.storages.RDBStorage(url=storage_setting)
+
+        storage = optuna.storages.RDBStorage(
+            url=storage_setting,
+            engine_kwargs={"connect_args": {"timeout": SQLITE_TIMEOUT_SECONDS}},
+        )
+        sqlalchemy.event.listen(storage.engine, "connect", _enable_sqlite_wal)
+        # Drop connections pooled while the schema was created, before the listener existed
+        storage.engine.dispose()
+        return storage
+
+    def _warm_up_backtest(self, market_data: pd.DataFrame) -> None:
+        """Run a throwaway backtest of the optimized strategy at its first feasible grid point.
+
+        vectorbt compiles its numba kernels on first use, which otherwise lands on
+        the first trial and distorts the per-trial timing statistics. Kernels are
+        compiled per code path (e.g. crossover exits), so the warm-up uses the real
+        strategy on the full data, where a trial's entries and exits occur too.
+        """
+        try:
+            warmup_config = self._config_for_params(self._first_feasible_params())
+            run_complete_backtest(warmup_config, market_data)
+        except Exception as e:
+            logger.debug(f"Backtest warm-up skipped: {e}")
+
+    def _first_feasible_params(self) -> Dict[str, Any]:
+        """The first grid point, in definition order, that satisfies the strategy constraints.
+
+        The point is replayed through the parameter parsers so its values have the same
+        types a trial would suggest.
+
+        Raises:
+            ConfigurationError: If no grid point is feasible
+        """
+        if not self._param_parsers:
+            return {}
+        search_space = self._get_grid_search_space()
+        for values in itertools.product(*search_space.values()):
+            params = dict(zip(search_space, values))
+            if all(value <= 0 for value in self._get_constraint_values(params).values()):
+                return self._replay_params(params)
+        raise ConfigurationError("No parameter combination satisfies the strategy constraints.")
+
     def _run_single_trial(self, trial: Trial, market_data) -> float:
         """Execute a single optimization trial with error handling.
         
@@ -313,69 +697,145 @@ class OptimizationEngine:
         Returns:
             Objective score or FAILED_TRIAL_SCORE
         """
+        concrete_params = self._begin_trial(trial)
+        return self._evaluate_trial(trial, concrete_params, market_data)
+
+    def _begin_trial(self, trial: Trial) -> Dict[str, Any]:
+        """Count a new trial and suggest its parameters.
+
+        Raises:
+            optuna.TrialPruned: If the run was interrupted or the parameters are invalid
+        """
         # Check for interruption
-        if self._interruption_event and self._interruption_event.is_set():
+        if self._is_interrupted():
             raise optuna.TrialPruned("Optimization interrupted")
-        self._current_trial += 1
-        concrete_params = self._suggest_params_for_trial(trial)
-        logger.info(f"Starting trial {trial.number} with params: {concrete_params}")
+        with self._state_lock:
+            self._current_trial += 1
+        return self._suggest_params_for_trial(trial)
+
+    def _evaluate_trial(self, trial: Trial, concrete_params: Dict[str, Any], market_data) -> float:
+        """Backtest and score one set of suggested parameters.
+
+        Samplers over small discrete spaces often repeat a parameter combination; a
+        repeat reuses the earlier score instead of running the backtest again.
+
+        Returns:
+            Objective score or FAILED_TRIAL_SCORE
+        """
+        params_key = tuple(concrete_params.values())
+        cached_score = self._scores_by_params.get(params_key)
+        if cached_score is not None:
+            logger.debug("Trial %d repeats params %s, reusing score: %s", trial.number, concrete_params, cached_score)
+            with self._state_lock:
+                self._successful_trials += 1
+            self._update_progress(concrete_params)
+            return cached_score
+
+        logger.debug("Starting trial %d with params: %s", trial.number, concrete_params)
         try:
-            # Create a temporary config dict for this trial by injecting concrete_params
-            trial_config_dict = self.strategy_config.model_dump()
-            trial_config_dict['strategy_params'] = concrete_params
-            # Create a StrategyConfig object for this trial to ensure a consistent interface
-            config_for_trial = StrategyConfig(**trial_config_dict)
+            config_for_trial = self._config_for_params(concrete_params)
 
             # Execute backtest with error handling
             backtest_result = run_complete_backtest(
                 config_for_trial,
                 market_data,
-                objective_params=self.objective_params
+                objective_params=self.objective_params,
+                on_primary_result=self._pruning_reporter(trial)
             )
             # Evaluate with objective function
             score = self.objective_function(backtest_result, self.objective_params)
-            # Update best score
-            if self._best_score is None or score > self._best_score:
-                self._best_score = score
-            self._successful_trials += 1
-            logger.info(f"Trial {trial.number} completed successfully with score: {score}")
-            # Update progress
+            logger.info("Trial %d completed successfully with score: %s", trial.number, score)
+            with self._state_lock:
+                self._scores_by_params[params_key] = score
+                # Update best score, keeping the analysis so the best trial never has to be re-run
+                if self._is_improvement(score):
+                    self._best_score = score
+                    self._best_trial_number = trial.number
+                    self._best_params = dict(concrete_params)
+                    self._best_analysis = backtest_result
+                self._successful_trials += 1
             self._update_progress(concrete_params)
             return score
+        except BacktestAborted as e:
+            logger.info("Trial %d pruned: %s", trial.number, e)
+            raise optuna.TrialPruned(str(e)) from e
         except DataError as e:
-            logger.warning(f"Trial {trial.number} failed: [{TrialFailureType.DATA_ERROR.value}] {e}. Params: {trial.params}")
+            logger.warning("Trial %d failed: [%s] %s. Params: %s", trial.number, TrialFailureType.DATA_ERROR.value, e, trial.params)
             self._record_failure(TrialFailureType.DATA_ERROR, trial.params)
             return FAILED_TRIAL_SCORE
         except BacktestError as e:
-            logger.warning(f"Trial {trial.number} failed: [{TrialFailureType.CALCULATION_ERROR.value}] {e}. Params: {trial.params}")
+            logger.warning("Trial %d failed: [%s] %s. Params: %s", trial.number, TrialFailureType.CALCULATION_ERROR.value, e, trial.params)
             self._record_failure(TrialFailureType.CALCULATION_ERROR, trial.params)
             return FAILED_TRIAL_SCORE
         except ConfigurationError as e:
-            logger.warning(f"Trial {trial.number} failed: [{TrialFailureType.VALIDATION_ERROR.value}] {e}. Params: {trial.params}")
+            logger.warning("Trial %d failed: [%s] %s. Params: %s", trial.number, TrialFailureType.VALIDATION_ERROR.value, e, trial.params)
             self._record_failure(TrialFailureType.VALIDATION_ERROR, trial.params)
             return FAILED_TRIAL_SCORE
         except Exception as e:
-            logger.debug(f"Trial {trial.number} failed with unexpected error. Params: {trial.params}", exc_info=True)
+            logger.debug("Trial %d failed with unexpected error. Params: %s", trial.number, trial.params, exc_info=True)
             self._record_failure(TrialFailureType.UNKNOWN_ERROR, trial.params)
             return FAILED_TRIAL_SCORE
     
+    def _pruning_reporter(self, trial: Trial) -> Optional[Callable[[BacktestResult], None]]:
+        """Build the callback that reports a trial's preliminary score to the pruner.
+
+        The score is taken from the primary backtest alone, before the fee-stress
+        robustness backtest runs, so a trial the pruner gives up on skips that backtest.
+        The objective functions only read ``primary_result``.
+        """
+        if not self._pruning_enabled:
+            return None
+
+        def report(primary_result: BacktestResult) -> None:
+            preliminary = BacktestAnalysisResult.model_construct(primary_result=primary_result)
+            trial.report(self.objective_function(preliminary, self.objective_params), step=PRIMARY_RESULT_STEP)
+            if trial.should_prune():
+                raise BacktestAborted("pruned after the primary backtest")
+        return report
+
+    def _config_for_params(self, concrete_params: Dict[str, Any]) -> StrategyConfig:
+        """Derive the StrategyConfig for one set of concrete parameters.
+
+        Only ``strategy_params`` changes between trials and the rest of the config was
+        validated once already, so a shallow copy replaces a full dump-and-revalidate.
+        The parameters themselves are still validated when signals are generated.
+        """
+        return self.strategy_config.model_copy(update={"strategy_params": concrete_params})
+
+    def _is_improvement(self, score: float) -> bool:
+        """Whether a score beats the best one so far in the study's direction."""
+        if self._best_score is None:
+            return True
+        if self._direction == "minimize":
+            return score < self._best_score
+        return score > self._best_score
+
     def _suggest_params_for_trial(self, trial: Trial) -> Dict[str, Any]:
         """
         Suggests parameter values for a given trial using the parameter definitions.
         """
-        params = {}
-        strategy_params_dict = self.strategy_config.strategy_params
-
-        for param_name, param_def in strategy_params_dict.items():
-            parser = _ParameterParser(param_name, param_def)
-            params[param_name] = parser.for_trial_suggestion(trial)
+        params = {parser.name: parser.for_trial_suggestion(trial) for parser in self._param_parsers}
 
-        # Add business logic validation to prune invalid trials early.
-        if 'fast_ma' in params and 'slow_ma' in params:
-            if params['fast_ma'] >= params['slow_ma']:
-                raise optuna.TrialPruned("fast_ma must be smaller than slow_ma.")
+        # Record the business-logic constraints on the trial so constraint-aware samplers
+        # (TPE, BoTorch) learn the infeasible region, then prune invalid trials early.
+        constraint_values = self._get_constraint_values(params)
+        for key, value in constraint_values.items():
+            trial.set_constraint(key, float(value))
+        if constraint_values.get("fast_ma_below_slow_ma", 0) > 0:
+            raise optuna.TrialPruned("fast_ma must be smaller than slow_ma.")
 
         return params
+
+    @staticmethod
+    def _get_constraint_values(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute constraint values for a parameter set; values <= 0 are feasible.
+
+        Works on scalar values as well as on NumPy columns of grid points.
+        """
+        constraint_values = {}
+        if 'fast_ma' in params and 'slow_ma' in params:
+            constraint_values["fast_ma_below_slow_ma"] = params['fast_ma'] - params['slow_ma'] + 1
+        return constraint_values
     
     def _record_failure(self, failure_type: TrialFailureType, params: Dict[str, Any]):
         """Record a trial failure by type.
@@ -384,35 +844,50 @@ class OptimizationEngine:
             failure_type: Type of failure encountered
             params: Parameters that caused the failure
         """
-        self._failed_trials_by_type[failure_type] += 1
+        with self._state_lock:
+            self._failed_trials_by_type[failure_type] += 1
+            # A new dict, so summaries already handed to callbacks stay unchanged
+            self._failure_summary = {
+                failure_type.value: count
+                for failure_type, count in self._failed_trials_by_type.items()
+                if count > 0
+            }
         self._update_progress(params)
     
-    def _update_progress(self, params: Dict[str, Any]):
+    def _update_progress(self, params: Dict[str, Any], final: bool = False):
         """Update progress tracking and call progress callback.
+
+        The snapshot is taken under ``_state_lock`` so it is consistent across threads,
+        and the callback runs after the lock is released so a slow renderer never
+        blocks the workers. Updates are coalesced so a fast backtest loop is not
+        throttled by the renderer; once every trial has started, or for the final
+        update of a run, each update is delivered.
         
         Args:
             params: Current trial parameters
+            final: Deliver the update regardless of coalescing
         """
-        if not self._progress_callback:
+        callback = self._progress_callback
+        if not callback:
             return
-            
-        elapsed = time.time() - self._start_time
-        failed_trials_summary = {
-            failure_type.value: count 
-            for failure_type, count in self._failed_trials_by_type.items()
-            if count > 0
-        }
-        
-        progress_data = ProgressData(
-            current_trial=self._current_trial,
-            total_trials=self._total_trials,
-            best_score=self._best_score,
-            elapsed_seconds=elapsed,
-            failed_trials_summary=failed_trials_summary,
-            current_params=params
-        )
-        
-        self._progress_callback(progress_data)
+
+        with self._state_lock:
+            now = time.monotonic()
+            all_trials_started = self._total_trials is not None and self._current_trial >= self._total_trials
+            if not (final or all_trials_started) and now - self._last_progress_emit < self._progress_min_interval:
+                return
+            self._last_progress_emit = now
+
+            progress_data = ProgressData(
+                current_trial=self._current_trial,
+                total_trials=self._total_trials,
+                best_score=self._best_score,
+                elapsed_seconds=now - self._start_time,
+                failed_trials_summary=self._failure_summary,
+                current_params=params
+            )
+
+        callback(progress_data)
     
     def _trial_callback(self, study, trial):
         """Optuna trial callback for progress updates."""
@@ -429,7 +904,10 @@ class OptimizationEngine:
         Returns:
             OptimizationResult with comprehensive statistics
         """
-        elapsed_time = time.time() - self._start_time
+        # Coalescing may have held back the last update of a timed-out or interrupted run
+        self._update_progress(self._best_params or {}, final=True)
+
+        elapsed_time = time.monotonic() - self._start_time
         total_failed = sum(self._failed_trials_by_type.values())
         
         error_summary = ErrorSummary(
@@ -437,6 +915,7 @@ class OptimizationEngine:
             failure_counts_by_type={
                 failure_type.value: count 
                 for failure_type, count in self._failed_trials_by_type.items()
+                if count > 0
             }
         )
         
@@ -446,24 +925,36 @@ class OptimizationEngine:
             "successful_trials_time": elapsed_time * (self._successful_trials / max(self._current_trial, 1))
         }
         
-        # Get best trial results
-        best_params = None
-        best_score = None
-        best_score_trial = None
+        # The best trial of this run is tracked in memory; only a resumed study
+        # can hold a better trial from an earlier run, so only then is the study queried
+        best_params = self._best_params
+        best_score = self._best_score
+        best_score_trial = self._best_trial_number
         best_strategy_analysis = None
-        if study.best_trial:
-            best_params = study.best_trial.params
-            best_score = study.best_value
-            best_score_trial = study.best_trial.number
-            
-            # Re-run backtest for the best params to get full analysis
-            if self._market_data is not None and best_params is not None:
+        if self._resumed_study:
+            try:
+                best_trial = study.best_trial
+            except ValueError:
+                best_trial = None
+            if best_trial is not None and best_trial.number != self._best_trial_number:
+                # The stored trial only holds suggested values; replay it to restore fixed params
+                try:
+                    best_params = self._replay_params(best_trial.params)
+                except ValueError:
+                    logger.warning("Best stored trial %d no longer fits the parameter definitions; "
+                                   "reporting its stored values", best_trial.number)
+                    best_params = best_trial.params
+                best_score = best_trial.value
+                best_score_trial = best_trial.number
+        if best_params is not None:
+            if self._best_analysis is not None and self._best_trial_number == best_score_trial:
+                # The analysis was kept when the best trial ran
+                best_strategy_analysis = self._best_analysis.model_dump()
+            # Otherwise re-run backtest for the best params to get full analysis
+            elif self._market_data is not None:
                 try:
                     logger.info(f"Re-running backtest for best parameters: {best_params}")
-                    # Create a new config dict for the best trial
-                    best_config_dict = self.strategy_config.model_dump()
-                    best_config_dict['strategy_params'] = best_params
-                    config_for_best_trial = StrategyConfig(**best_config_dict)
+                    config_for_best_trial = self._config_for_params(best_params)
 
                     analysis = run_complete_backtest(
                         config_for_best_trial,
@@ -481,6 +972,8 @@ class OptimizationEngine:
             total_trials=self._current_trial,
             successful_trials=self._successful_trials,
             error_summary=error_summary,
+            timing_info=timing_info,
             was_interrupted=self._was_interrupted,
+            best_strategy_analysis=best_strategy_analysis,
             constraint_adherence=None
         )
\ No newline at end of file
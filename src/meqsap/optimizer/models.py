@@ -17,6 +17,10 @@ class TrialFailureType(Enum):
 @dataclass
 class ProgressData:
     """Progress data for real-time optimization updates."""
+    # Built for every progress update; slots keep each instance small (dataclass(slots=True) needs 3.10)
+    __slots__ = ("current_trial", "total_trials", "best_score", "elapsed_seconds",
+                 "failed_trials_summary", "current_params")
+
     current_trial: int
     total_trials: Optional[int]
     best_score: Optional[float]
@@ -6,6 +6,7 @@ the performance of a strategy during optimization.
 """
 
 from typing import Protocol, Any, Dict, Callable
+import functools
 import logging
 
 from ..backtest import BacktestAnalysisResult
@@ -81,10 +82,13 @@ OBJECTIVE_FUNCTION_REGISTRY: Dict[str, ObjectiveFunction] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def get_objective_function(name: str) -> ObjectiveFunction:
     """
     Retrieves an objective function from the registry by name (case-insensitive).
 
+    Lookups are memoized per name; unknown names are not cached and raise every time.
+
     Args:
         name: The name of the objective function.
 
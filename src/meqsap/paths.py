@@ -0,0 +1,9 @@
+"""Filesystem locations shared across MEQSAP modules.
+
+Kept free of third-party imports so any module can locate the cache cheaply.
+"""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = PROJECT_ROOT / 'data' / 'cache'
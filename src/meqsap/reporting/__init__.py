@@ -9,6 +9,8 @@ from .format_utils import (
     format_number,
     get_performance_color,
     format_performance_metrics,
+    format_performance_metrics_batch,
+    performance_metric_values,
     determine_overall_verdict,
     create_strategy_summary_table,
     create_performance_table,
@@ -18,6 +20,7 @@ from .format_utils import (
     generate_executive_verdict,
     prepare_returns_for_pyfolio,
     generate_pdf_report,
+    generate_pdf_reports,
     PYFOLIO_AVAILABLE,
 )
 from ..exceptions import ReportingError
@@ -27,7 +30,7 @@ __all__ = [
     'ReportConfig',
     'ExecutiveVerdictData',
     'BaseReporter',
-    'TerminalReporter', 
+    'TerminalReporter',
     'HtmlReporter',
     'PdfReporter',
     'ReportingOrchestrator',
@@ -38,6 +41,8 @@ __all__ = [
     'format_number',
     'get_performance_color',
     'format_performance_metrics',
+    'format_performance_metrics_batch',
+    'performance_metric_values',
     'determine_overall_verdict',
     'create_strategy_summary_table',
     'create_performance_table',
@@ -47,5 +52,6 @@ __all__ = [
     'generate_executive_verdict',
     'prepare_returns_for_pyfolio',
     'generate_pdf_report',
+    'generate_pdf_reports',
     'PYFOLIO_AVAILABLE',
 ]
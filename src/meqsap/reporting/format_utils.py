@@ -1,38 +1,146 @@
 """Utility functions for formatting report data."""
 
 import os
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import multiprocessing
+import shutil
+import tempfile
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Callable, Dict, Any, Optional, List, Sequence, Union, Tuple
 from rich.table import Table
 from rich.panel import Panel
 from rich.console import Console
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from pydantic import BaseModel
 import warnings
+import weakref
 
 from ..backtest import BacktestAnalysisResult, BacktestResult, VibeCheckResults, RobustnessResults
 from ..exceptions import ReportingError
 from ..config import StrategyConfig
+from ..paths import CACHE_DIR
 
-# Flag indicating whether pyfolio is available
-try:
-    import pyfolio as pf
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
-    PYFOLIO_AVAILABLE = True
-except ImportError:
-    PYFOLIO_AVAILABLE = False
+# Flag indicating whether pyfolio is available. pyfolio pulls in scipy, statsmodels and
+# seaborn, so the modules themselves are only imported by _load_pyfolio when a PDF is rendered.
+PYFOLIO_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ("pyfolio", "matplotlib"))
+_PYFOLIO_REQUIRED_MESSAGE = "PDF report generation requires pyfolio. Install with: pip install pyfolio"
+pf = None
+plt = None
+
+
+def _load_pyfolio() -> None:
+    """Import pyfolio and matplotlib on first use, with matplotlib's non-interactive backend.
+
+    Raises:
+        ReportingError: If an installed pyfolio or matplotlib fails to import
+    """
+    global pf, plt
+    if pf is None:
+        try:
+            import pyfolio
+            import matplotlib
+            matplotlib.use('Agg')  # Use non-interactive backend
+            import matplotlib.pyplot
+        except ImportError as e:
+            raise ReportingError(_PYFOLIO_REQUIRED_MESSAGE) from e
+        pf, plt = pyfolio, matplotlib.pyplot
+
+
+def _higher_is_better(good: float, bad: float) -> Callable[[float], str]:
+    def color(value: float) -> str:
+        if value >= good:
+            return "green"
+        elif value <= bad:
+            return "red"
+        else:
+            return "yellow"
+    return color
+
+
+def _drawdown_color(good: float, bad: float) -> Callable[[float], str]:
+    # For drawdown, less negative is better. Positive values are invalid.
+    def color(value: float) -> str:
+        if value > 0:
+            return "red"
+        if value >= good:  # e.g. -5.0 >= -10.0
+            return "green"
+        elif value <= bad:
+            return "red"
+        else:
+            return "yellow"
+    return color
+
+
+def _default_color(value: float) -> str:
+    return "white"
+
+
+# Lookup tables shared by the formatters and table builders, built once at import
+_COLOR_RULES = MappingProxyType({
+    "total_return": _higher_is_better(good=10.0, bad=-5.0),  # Thresholds in percentage
+    "annual_return": _higher_is_better(good=15.0, bad=0.0),
+    "sharpe_ratio": _higher_is_better(good=1.0, bad=0.0),
+    "max_drawdown": _drawdown_color(good=-10.0, bad=-25.0),  # Note: negative values
+    "win_rate": _higher_is_better(good=55.0, bad=45.0),
+})
+
+_METRIC_DISPLAY_NAMES = MappingProxyType({
+    "total_return": "Total Return",
+    "annual_return": "Annual Return",
+    "sharpe_ratio": "Sharpe Ratio",
+    "max_drawdown": "Max Drawdown",
+    "win_rate": "Win Rate",
+    "profit_factor": "Profit Factor",
+    "total_trades": "Total Trades"
+})
+
+_PERCENTAGE_METRICS = frozenset({"total_return", "annual_return", "win_rate", "max_drawdown"})
+
+_VIBE_CHECK_DISPLAY_NAMES = MappingProxyType({
+    "minimum_trades_check": "Minimum Trades",
+    "signal_quality_check": "Signal Quality",
+    "data_coverage_check": "Data Coverage",
+    "overall_pass": "Overall Status",
+})
+
+_ROBUSTNESS_DISPLAY_NAMES = MappingProxyType({
+    "baseline_sharpe": "Baseline Sharpe",
+    "high_fees_sharpe": "High Fees Sharpe",
+    "turnover_rate": "Turnover Rate",
+    "sharpe_degradation": "Sharpe Degradation",
+    "return_degradation": "Return Degradation",
+})
+
+
+def _is_missing(value: Any) -> bool:
+    """True for None, NaN, +/-inf and other non-numeric values, which render as N/A."""
+    try:
+        return value is None or not math.isfinite(value)
+    except TypeError:  # e.g. pd.NA
+        return True
+
+
+@functools.lru_cache(maxsize=16)
+def _fixed_point_formatter(decimal_places: int, thousands: bool = False) -> Callable[[Any], str]:
+    """Return a bound str.format for fixed-point output, so each spec is built once per precision."""
+    separator = "," if thousands else ""
+    return f"{{:{separator}.{decimal_places}f}}".format
 
 
 def format_percentage(value: float, decimal_places: int = 2, include_sign: bool = True) -> str:
     """Format a decimal value as a percentage."""
-    if value is None or pd.isna(value) or not np.isfinite(value):
+    if _is_missing(value):
         return "N/A"
     
-    formatted = f"{value:.{decimal_places}f}%"
+    formatted = _fixed_point_formatter(decimal_places)(value) + "%"
     if include_sign and value > 0:
         formatted = "+" + formatted
     return formatted
@@ -40,56 +148,48 @@ def format_percentage(value: float, decimal_places: int = 2, include_sign: bool
 
 def format_currency(value: float, decimal_places: int = 2) -> str:
     """Format a value as currency."""
-    if value is None or pd.isna(value) or not np.isfinite(value):
+    if _is_missing(value):
         return "N/A"
     
-    return f"${value:,.{decimal_places}f}"
+    return "$" + _fixed_point_formatter(decimal_places, thousands=True)(value)
 
 
-def format_number(value: float, decimal_places: int = 2) -> str:
+def format_number(value: float, decimal_places: int = 2, include_sign: bool = False) -> str:
     """Format a numeric value with specified decimal places."""
-    if value is None or pd.isna(value) or not np.isfinite(value):
+    if _is_missing(value):
         return "N/A"
     
-    return f"{value:.{decimal_places}f}"
+    formatted = _fixed_point_formatter(decimal_places)(value)
+    if include_sign and value > 0:
+        formatted = "+" + formatted
+    return formatted
 
 
 def get_performance_color(metric_name: str, value: float) -> str:
     """Get color code for performance metrics based on thresholds."""
-    if value is None or pd.isna(value) or not np.isfinite(value):
+    if _is_missing(value):
         return "white"
+    return _COLOR_RULES.get(metric_name, _default_color)(value)
+
+
+def performance_metric_values(backtest_result: BacktestResult) -> Dict[str, float]:
+    """Collect the raw performance metrics of a backtest result.
     
-    color_rules = {
-        "total_return": {"good": 10.0, "bad": -5.0},  # Thresholds in percentage
-        "annual_return": {"good": 15.0, "bad": 0.0},
-        "sharpe_ratio": {"good": 1.0, "bad": 0.0},
-        "max_drawdown": {"good": -10.0, "bad": -25.0},  # Note: negative values
-        "win_rate": {"good": 55.0, "bad": 45.0},
+    The keys match format_performance_metrics, so the numbers can be passed to the
+    table builders alongside the formatted strings instead of being parsed back.
+    """
+    return {
+        "total_return": backtest_result.total_return,
+        "annual_return": backtest_result.annualized_return,
+        "sharpe_ratio": backtest_result.sharpe_ratio,
+        "max_drawdown": backtest_result.max_drawdown,
+        "win_rate": backtest_result.win_rate,
+        "volatility": backtest_result.volatility,
+        "calmar_ratio": backtest_result.calmar_ratio,
+        "final_value": backtest_result.final_value,
+        "profit_factor": backtest_result.profit_factor,
+        "total_trades": backtest_result.total_trades,
     }
-    
-    if metric_name not in color_rules:
-        return "white"
-    
-    thresholds = color_rules[metric_name]
-    
-    if metric_name == "max_drawdown":
-        # For drawdown, less negative is better. Positive values are invalid.
-        if value > 0:
-            return "red"
-        if value >= thresholds["good"]: # e.g. -5.0 >= -10.0
-            return "green"
-        elif value <= thresholds["bad"]:
-            return "red"
-        else:
-            return "yellow"
-    else:
-        # For other metrics, higher is better
-        if value >= thresholds["good"]:
-            return "green"
-        elif value <= thresholds["bad"]:
-            return "red"
-        else:
-            return "yellow"
 
 
 def format_performance_metrics(backtest_result: BacktestResult, decimal_places: int = 2) -> Dict[str, str]:
@@ -102,18 +202,74 @@ def format_performance_metrics(backtest_result: BacktestResult, decimal_places:
     Returns:
         A dictionary of formatted performance metrics.
     """
+    values = performance_metric_values(backtest_result)
     return {
-        "total_return": format_percentage(backtest_result.total_return, decimal_places),
-        "annual_return": format_percentage(backtest_result.annualized_return, decimal_places),
-        "sharpe_ratio": format_number(backtest_result.sharpe_ratio, decimal_places),
-        "max_drawdown": format_percentage(backtest_result.max_drawdown, decimal_places),
-        "win_rate": format_percentage(backtest_result.win_rate, decimal_places),
-        "volatility": format_percentage(backtest_result.volatility, decimal_places),
-        "calmar_ratio": format_number(backtest_result.calmar_ratio, decimal_places),
-        "final_value": format_currency(backtest_result.final_value),
-        "profit_factor": format_number(backtest_result.profit_factor, decimal_places),
-        "total_trades": str(backtest_result.total_trades),
+        "total_return": format_percentage(values["total_return"], decimal_places),
+        "annual_return": format_percentage(values["annual_return"], decimal_places),
+        "sharpe_ratio": format_number(values["sharpe_ratio"], decimal_places),
+        "max_drawdown": format_percentage(values["max_drawdown"], decimal_places),
+        "win_rate": format_percentage(values["win_rate"], decimal_places),
+        "volatility": format_percentage(values["volatility"], decimal_places),
+        "calmar_ratio": format_number(values["calmar_ratio"], decimal_places),
+        "final_value": format_currency(values["final_value"]),
+        "profit_factor": format_number(values["profit_factor"], decimal_places),
+        "total_trades": str(values["total_trades"]),
+    }
+
+
+def _format_column(values: np.ndarray, spec: str, include_sign: bool = False) -> List[str]:
+    """Vectorized counterpart of the scalar formatters for a float array."""
+    formatted = np.char.mod(spec, values)
+    if include_sign:
+        formatted = np.char.add(np.where(values > 0, "+", ""), formatted)
+    return np.where(np.isfinite(values), formatted, "N/A").tolist()
+
+
+def format_performance_metrics_batch(backtest_results: Sequence[BacktestAnalysisResult],
+                                     decimal_places: int = 2) -> pd.DataFrame:
+    """Format the performance metrics of many results at once.
+    
+    Each metric is gathered into one array and formatted in a single pass. Rows match
+    format_performance_metrics for each primary result and are indexed by strategy type.
+    """
+    primaries = [result.primary_result for result in backtest_results]
+    
+    def column(attribute: str) -> np.ndarray:
+        return np.fromiter((getattr(result, attribute) for result in primaries),
+                           dtype=np.float64, count=len(primaries))
+    
+    pct_spec = f"%.{decimal_places}f%%"
+    num_spec = f"%.{decimal_places}f"
+    final_values = column("final_value")
+    columns = {
+        "total_return": _format_column(column("total_return"), pct_spec, include_sign=True),
+        "annual_return": _format_column(column("annualized_return"), pct_spec, include_sign=True),
+        "sharpe_ratio": _format_column(column("sharpe_ratio"), num_spec),
+        "max_drawdown": _format_column(column("max_drawdown"), pct_spec, include_sign=True),
+        "win_rate": _format_column(column("win_rate"), pct_spec, include_sign=True),
+        "volatility": _format_column(column("volatility"), pct_spec, include_sign=True),
+        "calmar_ratio": _format_column(column("calmar_ratio"), num_spec),
+        # printf-style specs have no thousands separator, so currency keeps the scalar path
+        "final_value": [format_currency(value) for value in final_values],
+        "profit_factor": _format_column(column("profit_factor"), num_spec),
+        "total_trades": [str(result.total_trades) for result in primaries],
     }
+    index = pd.Index([result.strategy_config.get("strategy_type") for result in backtest_results],
+                     name="strategy")
+    return pd.DataFrame(columns, index=index, dtype=object)
+
+
+_STRIP_METRIC_DECORATIONS = str.maketrans("", "", "%+")
+
+
+def _parse_metric_value(value: Any) -> float:
+    """Recover the number behind a formatted metric; NaN when there is none."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value.translate(_STRIP_METRIC_DECORATIONS))
+    except (ValueError, AttributeError):
+        return np.nan
 
 
 def determine_overall_verdict(
@@ -158,51 +314,68 @@ def determine_overall_verdict(
     return verdict, recommendations
 
 
-def create_strategy_summary_table(metrics: Dict[str, str], color_output: bool = True) -> Table:
-    """Create a Rich table with strategy performance summary."""
+def _field_values(data: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """Top-level fields of a model as a dict, without model_dump's recursive serialization."""
+    if isinstance(data, BaseModel):
+        return {name: getattr(data, name) for name in type(data).model_fields}
+    return data
+
+
+def create_strategy_summary_table(metrics: Dict[str, str], color_output: bool = True,
+                                  metric_values: Optional[Dict[str, float]] = None) -> Table:
+    """Create a Rich table with strategy performance summary.
+    
+    When metric_values (see performance_metric_values) is given, colors are chosen from
+    those numbers; otherwise the formatted strings are parsed.
+    """
     table = Table(title="Strategy Summary", show_header=True)
     
     table.add_column("Metric", style="dim")
     table.add_column("Value")
     
-    metric_display_names = {
-        "total_return": "Total Return",
-        "annual_return": "Annual Return",
-        "sharpe_ratio": "Sharpe Ratio",
-        "max_drawdown": "Max Drawdown",
-        "win_rate": "Win Rate",
-        "profit_factor": "Profit Factor",
-        "total_trades": "Total Trades"
-    }
+    def row_style(metric: str, value: str) -> Optional[str]:
+        if not (color_output and metric in _COLOR_RULES):
+            return None
+        numeric_value = metric_values[metric] if metric_values else _parse_metric_value(value)
+        return get_performance_color(metric, numeric_value)
     
-    for metric, value in metrics.items():
-        if metric in metric_display_names:
-            display_name = metric_display_names[metric]
-            
-            if color_output and metric in ("total_return", "annual_return", "sharpe_ratio", "max_drawdown", "win_rate"):
-                # Extract the numeric value for color determination
-                try:
-                    if value == "N/A":
-                        numeric_value = np.nan
-                    elif "%" in value:
-                        numeric_value = float(value.replace("%", "").replace("+", ""))
-                    else:
-                        numeric_value = float(value)
-                    
-                    color = get_performance_color(metric, numeric_value)
-                    table.add_row(display_name, value, style=color)
-                except (ValueError, TypeError):
-                    table.add_row(display_name, value)
-            else:
-                table.add_row(display_name, value)
+    rows = [
+        (_METRIC_DISPLAY_NAMES[metric], value, row_style(metric, value))
+        for metric, value in metrics.items() if metric in _METRIC_DISPLAY_NAMES
+    ]
+    for display_name, value, style in rows:
+        table.add_row(display_name, value, style=style)
     
     return table
 
 
+def _format_count_diff(diff: float) -> str:
+    return "N/A" if _is_missing(diff) else f"{int(diff):+d}"
+
+
+def _format_na_diff(diff: float) -> str:
+    return "N/A"
+
+
+# Candidate-minus-baseline formatter per metric; metrics without one show N/A
+_DIFF_FORMATTERS = MappingProxyType({
+    **{metric: functools.partial(format_percentage, include_sign=True) for metric in _PERCENTAGE_METRICS},
+    "sharpe_ratio": functools.partial(format_number, include_sign=True),
+    "profit_factor": functools.partial(format_number, include_sign=True),
+    "total_trades": _format_count_diff,
+})
+
+
 def create_performance_table(candidate_metrics: Dict[str, str], 
                              baseline_metrics: Optional[Dict[str, str]] = None,
-                             color_output: bool = True) -> Table:
-    """Create a performance comparison table between candidate and baseline."""
+                             color_output: bool = True,
+                             candidate_values: Optional[Dict[str, float]] = None,
+                             baseline_values: Optional[Dict[str, float]] = None) -> Table:
+    """Create a performance comparison table between candidate and baseline.
+    
+    Differences are computed from candidate_values/baseline_values (see
+    performance_metric_values) when given, otherwise from the parsed formatted strings.
+    """
     table = Table(title="Performance Metrics", show_header=True)
     
     table.add_column("Metric", style="dim")
@@ -210,66 +383,25 @@ def create_performance_table(candidate_metrics: Dict[str, str],
     if baseline_metrics:
         table.add_column("Baseline")
     
-    metric_display_names = {
-        "total_return": "Total Return",
-        "annual_return": "Annual Return",
-        "sharpe_ratio": "Sharpe Ratio",
-        "max_drawdown": "Max Drawdown",
-        "win_rate": "Win Rate",
-        "profit_factor": "Profit Factor",
-        "total_trades": "Total Trades"
-    }
+    candidate_metrics_dict = _field_values(candidate_metrics)
+    shown = [(metric, value) for metric, value in candidate_metrics_dict.items() if metric in _METRIC_DISPLAY_NAMES]
     
-    candidate_metrics_dict = candidate_metrics.model_dump() if isinstance(candidate_metrics, BaseModel) else candidate_metrics
-    for metric, candidate_value in candidate_metrics_dict.items():
-        if metric in metric_display_names:
-            display_name = metric_display_names[metric]
-            
-            if baseline_metrics and metric in baseline_metrics:
-                baseline_value = baseline_metrics[metric]
-                
-                # Calculate difference for percentage metrics
-                if metric in ("total_return", "annual_return", "win_rate", "max_drawdown"):
-                    try:
-                        if candidate_value == "N/A" or baseline_value == "N/A":
-                            diff_value = "N/A"
-                        else:
-                            candidate_num = float(candidate_value.replace("%", "").replace("+", ""))
-                            baseline_num = float(baseline_value.replace("%", "").replace("+", ""))
-                            diff = candidate_num - baseline_num
-                            diff_value = format_percentage(diff, include_sign=True)
-                    except (ValueError, AttributeError):
-                        diff_value = "N/A"
-                # Calculate difference for numeric metrics
-                elif metric in ("sharpe_ratio", "profit_factor"):
-                    try:
-                        if candidate_value == "N/A" or baseline_value == "N/A":
-                            diff_value = "N/A"
-                        else:
-                            candidate_num = float(candidate_value)
-                            baseline_num = float(baseline_value)
-                            diff = candidate_num - baseline_num
-                            diff_value = format_number(diff, include_sign=True)
-                    except (ValueError, AttributeError):
-                        diff_value = "N/A"
-                # Calculate difference for count metrics
-                elif metric == "total_trades":
-                    try:
-                        candidate_num = int(candidate_value)
-                        baseline_num = int(baseline_value)
-                        diff = candidate_num - baseline_num
-                        diff_value = f"{diff:+d}"
-                    except (ValueError, TypeError):
-                        diff_value = "N/A"
-                else:
-                    diff_value = "N/A"
-                
-                table.add_row(display_name, candidate_value, baseline_value, diff_value)
-            else:
-                if baseline_metrics:
-                    table.add_row(display_name, candidate_value, "N/A", "N/A")
-                else:
-                    table.add_row(display_name, candidate_value)
+    if not baseline_metrics:
+        rows = [(_METRIC_DISPLAY_NAMES[metric], value) for metric, value in shown]
+    else:
+        rows = []
+        for metric, candidate_value in shown:
+            if metric not in baseline_metrics:
+                rows.append((_METRIC_DISPLAY_NAMES[metric], candidate_value, "N/A", "N/A"))
+                continue
+            baseline_value = baseline_metrics[metric]
+            candidate_num = candidate_values[metric] if candidate_values else _parse_metric_value(candidate_value)
+            baseline_num = baseline_values[metric] if baseline_values else _parse_metric_value(baseline_value)
+            diff_value = _DIFF_FORMATTERS.get(metric, _format_na_diff)(candidate_num - baseline_num)
+            rows.append((_METRIC_DISPLAY_NAMES[metric], candidate_value, baseline_value, diff_value))
+    
+    for row in rows:
+        table.add_row(*row)
     
     return table
 
@@ -282,21 +414,14 @@ def create_vibe_check_table(vibe_check_results: Dict[str, Any],
     table.add_column("Check", style="dim", no_wrap=True)
     table.add_column("Status", justify="center")
     
-    vibe_check_dict = vibe_check_results.model_dump() if isinstance(vibe_check_results, BaseModel) else vibe_check_results
+    vibe_check_dict = _field_values(vibe_check_results)
     if not vibe_check_dict:
          table.add_row("No Data", "No vibe check results available")
          return table
     
-    check_display_names = {
-         "minimum_trades_check": "Minimum Trades",
-         "signal_quality_check": "Signal Quality",
-         "data_coverage_check": "Data Coverage",
-         "overall_pass": "Overall Status",
-     }
-    
     for check, passed in vibe_check_dict.items():
-        if check in check_display_names:
-            display_name = check_display_names[check]
+        if check in _VIBE_CHECK_DISPLAY_NAMES:
+            display_name = _VIBE_CHECK_DISPLAY_NAMES[check]
             if isinstance(passed, bool):
                 status_text = "PASS" if passed else "FAIL"
                 if color_output:
@@ -316,22 +441,14 @@ def create_robustness_table(robustness_results: Dict[str, Any],
     table.add_column("Check", style="dim", no_wrap=True)
     table.add_column("Value")
     
-    robustness_dict = robustness_results.model_dump() if isinstance(robustness_results, BaseModel) else robustness_results
+    robustness_dict = _field_values(robustness_results)
     if not robustness_dict:
          table.add_row("No Data", "No robustness results available")
          return table
     
-    check_display_names = {
-         "baseline_sharpe": "Baseline Sharpe",
-         "high_fees_sharpe": "High Fees Sharpe",
-         "turnover_rate": "Turnover Rate",
-         "sharpe_degradation": "Sharpe Degradation",
-         "return_degradation": "Return Degradation",
-     }
-     
     for check, value in robustness_dict.items():
-        if check in check_display_names:
-             display_name = check_display_names[check]
+        if check in _ROBUSTNESS_DISPLAY_NAMES:
+             display_name = _ROBUSTNESS_DISPLAY_NAMES[check]
              if isinstance(value, (float, int)):
                  formatted_value = f"{value:.2f}"
                  if "degradation" in check or "turnover" in check:
@@ -411,40 +528,139 @@ def prepare_returns_for_pyfolio(backtest_result: BacktestResult) -> pd.Series:
     if not backtest_result.portfolio_value_series:
         raise ReportingError("No portfolio value series available for pyfolio conversion")
     
-    # Convert portfolio values to returns
-    portfolio_values = pd.Series(backtest_result.portfolio_value_series)
-    portfolio_values.index = pd.to_datetime(portfolio_values.index)
+    series = backtest_result.portfolio_value_series
+    values = np.fromiter(series.values(), dtype=np.float64, count=len(series))
     
-    # Calculate daily returns
-    returns = portfolio_values.pct_change().dropna()
+    # Calculate daily returns on the raw array; NaN returns are dropped as dropna() would
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = values[1:] / values[:-1] - 1.0
+    keep = ~np.isnan(returns)
     
-    if returns.empty:
+    if not keep.any():
         raise ReportingError("Unable to calculate returns from portfolio values")
     
     # Check for degenerate cases where returns are meaningless for analysis
-    if (returns.abs() < 1e-10).all():
+    if not (np.abs(returns[keep]) >= 1e-10).any():
         raise ReportingError("Unable to calculate returns: portfolio values are constant (zero returns)")
     
+    dates = pd.to_datetime(list(series))[1:]
+    return pd.Series(returns[keep], index=dates[keep])
+
+
+# Returns prepared for PDF export, keyed by id() of the owning BacktestResult. Entries
+# are dropped when the result is garbage collected, so ids cannot be reused stale.
+_PYFOLIO_RETURNS_CACHE: Dict[int, Tuple[Tuple[Any, ...], pd.Series]] = {}
+
+
+def _series_fingerprint(series: Dict[str, float]) -> Tuple[Any, ...]:
+    """Cheap content key for a portfolio value series: its length, date bounds and a digest of the values.
+
+    Reading the values into an array and hashing it costs about a tenth of the date
+    parsing in prepare_returns_for_pyfolio, and no Python object per row is built.
+    """
+    if not series:
+        return ()
+    values = np.fromiter(series.values(), dtype=np.float64, count=len(series))
+    return (len(series), next(iter(series)), next(reversed(series)),
+            hashlib.blake2b(values.tobytes(), digest_size=16).digest())
+
+
+def _cached_pyfolio_returns(backtest_result: BacktestResult) -> pd.Series:
+    """prepare_returns_for_pyfolio, memoized across repeated exports of the same result."""
+    result_id = id(backtest_result)
+    # Any change to the series values or date range, in place or by reassignment, invalidates the entry
+    fingerprint = _series_fingerprint(backtest_result.portfolio_value_series)
+    cached = _PYFOLIO_RETURNS_CACHE.get(result_id)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    returns = prepare_returns_for_pyfolio(backtest_result)
+    if cached is None:
+        weakref.finalize(backtest_result, _PYFOLIO_RETURNS_CACHE.pop, result_id, None)
+    _PYFOLIO_RETURNS_CACHE[result_id] = (fingerprint, returns)
     return returns
 
 
+# Tear sheets depend only on the returns series and the renderer, so rendered PDFs are
+# cached by the series content, the pyfolio and matplotlib versions and the layout version
+PDF_CACHE_DIR = CACHE_DIR / 'pdf'
+PDF_CACHE_MAX_BYTES = 500 * 1024 * 1024
+PDF_LAYOUT_VERSION = 1  # Bump when the tear sheet options or styling below change
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_renderer_versions() -> str:
+    """Installed pyfolio and matplotlib versions, read from package metadata so neither is imported."""
+    versions = []
+    for distributions in (("pyfolio", "pyfolio-reloaded"), ("matplotlib",)):
+        for distribution in distributions:
+            try:
+                versions.append(importlib.metadata.version(distribution))
+                break
+            except importlib.metadata.PackageNotFoundError:
+                continue
+        else:
+            versions.append("unknown")
+    return "/".join(versions)
+
+
+def _pdf_cache_key(returns: pd.Series) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{PDF_LAYOUT_VERSION}/{_pdf_renderer_versions()}".encode())
+    digest.update(returns.index.asi8.tobytes())
+    digest.update(returns.to_numpy(dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _store_pdf_in_cache(pdf_path: Path, cached_path: Path) -> None:
+    """Copy a rendered PDF into the cache, then evict least recently used files over the cap."""
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cached_path.parent, suffix='.tmp')
+    os.close(fd)
+    shutil.copyfile(pdf_path, tmp_name)
+    os.replace(tmp_name, cached_path)
+    
+    entries = sorted(
+        ((entry.stat().st_mtime, entry.stat().st_size, entry) for entry in cached_path.parent.glob('*.pdf')),
+        reverse=True
+    )
+    total = 0
+    for _, size, entry in entries:
+        total += size
+        if total > PDF_CACHE_MAX_BYTES and entry != cached_path:
+            entry.unlink(missing_ok=True)
+
+
 def generate_pdf_report(
     backtest_result: BacktestAnalysisResult,
     output_path: Union[str, Path],
-    include_plots: bool = True  # This param is not used by pyfolio tear sheet
+    include_plots: bool = True,  # This param is not used by pyfolio tear sheet
+    force: bool = False
 ) -> Path:
-    """Generate a comprehensive PDF report using pyfolio."""
+    """Generate a comprehensive PDF report using pyfolio.
+    
+    A previously rendered tear sheet for the same returns is copied from PDF_CACHE_DIR
+    instead of being regenerated, unless force is True.
+    """
     if not PYFOLIO_AVAILABLE:
-        raise ReportingError(
-            "PDF report generation requires pyfolio. Install with: pip install pyfolio"
-        )
+        raise ReportingError(_PYFOLIO_REQUIRED_MESSAGE)
     
     output_path_obj = Path(output_path)
     output_path_obj.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        returns = prepare_returns_for_pyfolio(backtest_result.primary_result)
+        returns = _cached_pyfolio_returns(backtest_result.primary_result)
+        cached_path = PDF_CACHE_DIR / f"{_pdf_cache_key(returns)}.pdf"
+        if not force:
+            # Another process may evict the entry at any time, so a missing file just means rendering
+            try:
+                os.utime(cached_path)  # Mark as recently used for eviction
+                shutil.copyfile(cached_path, output_path_obj)
+                return output_path_obj
+            except FileNotFoundError:
+                pass
         
+        _load_pyfolio()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             with plt.style.context('seaborn-v0_8'):
@@ -456,7 +672,46 @@ def generate_pdf_report(
                 fig.savefig(str(output_path_obj), format='pdf', bbox_inches='tight', dpi=300)
                 plt.close(fig)
         
+        try:
+            _store_pdf_in_cache(output_path_obj, cached_path)
+        except OSError:
+            pass  # The report itself was written; caching is best effort
+        
         return output_path_obj
         
+    except ReportingError:
+        raise
     except Exception as e:
         raise ReportingError(f"PDF report generation failed: {str(e)}") from e
+
+
+def _generate_pdf_report_worker(args: Tuple[BacktestAnalysisResult, Path]) -> Path:
+    return generate_pdf_report(*args)
+
+
+def generate_pdf_reports(
+    backtest_results: Sequence[BacktestAnalysisResult],
+    output_dir: Union[str, Path]
+) -> List[Path]:
+    """Generate one PDF report per result in separate processes.
+    
+    pyfolio and matplotlib keep global state, so reports cannot be rendered from
+    threads; each worker is a spawned process that configures its own Agg backend.
+    Reports are named after their position and strategy type.
+    """
+    if not PYFOLIO_AVAILABLE:
+        raise ReportingError(_PYFOLIO_REQUIRED_MESSAGE)
+    
+    output_dir_obj = Path(output_dir)
+    jobs = [
+        (result, output_dir_obj / f"{index:03d}_{result.strategy_config.get('strategy_type', 'strategy')}.pdf")
+        for index, result in enumerate(backtest_results)
+    ]
+    if len(jobs) <= 1:
+        return [generate_pdf_report(*job) for job in jobs]
+    
+    # Leave headroom for matplotlib's own threads
+    max_workers = max(1, min(len(jobs), (os.cpu_count() or 2) // 2))
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(_generate_pdf_report_worker, jobs))
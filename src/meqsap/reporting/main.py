@@ -58,6 +58,9 @@ def generate_complete_report(
     Returns:
         Path to PDF report if generated, None otherwise
     """
+    if quiet and not include_pdf:
+        return None  # No reporter would run
+
     pdf_path = Path(output_directory) / "report.pdf"
 
     orchestrator = ReportingOrchestrator()
@@ -67,7 +70,6 @@ def generate_complete_report(
         orchestrator.add_reporter(PdfReporter(output_path=str(pdf_path)))
 
     # Create a wrapper ComparativeAnalysisResult for the single analysis_result
-    from .models import ComparativeAnalysisResult
     result = ComparativeAnalysisResult(
         candidate_result=analysis_result,
         baseline_result=None,
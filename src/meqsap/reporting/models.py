@@ -1,7 +1,7 @@
 """Data models for comparative analysis reporting."""
 
-from typing import Optional
-from pydantic import BaseModel, model_validator, Field
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, model_validator, Field
 from ..backtest import BacktestAnalysisResult
 
 
@@ -36,11 +36,13 @@ class ExecutiveVerdictData(BaseModel):
 class ComparativeAnalysisResult(BaseModel):
     """Holds results from both candidate and baseline strategy backtests."""
     
+    model_config = ConfigDict(frozen=True)
+    
     candidate_result: BacktestAnalysisResult
     baseline_result: Optional[BacktestAnalysisResult] = None
     baseline_failed: bool = False
     baseline_failure_reason: Optional[str] = None
-    comparative_verdict: Optional[str] = None  # "Outperformed" | "Underperformed"
+    comparative_verdict: Optional[Literal["Outperformed", "Underperformed"]] = None
     
     @model_validator(mode='after')
     def check_consistency(self) -> 'ComparativeAnalysisResult':
@@ -52,8 +54,6 @@ class ComparativeAnalysisResult(BaseModel):
         if self.comparative_verdict is not None:
             if self.baseline_result is None or self.baseline_failed:
                 raise ValueError("comparative_verdict requires a successful baseline_result")
-            if self.comparative_verdict not in ["Outperformed", "Underperformed"]:
-                raise ValueError("comparative_verdict must be 'Outperformed' or 'Underperformed'")
         return self
     
     @property
@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import pandas as pd
 from rich.console import Console
@@ -30,6 +30,14 @@ class BaseReporter(ABC):
 class TerminalReporter(BaseReporter):
     """Rich terminal-based comparative reporting."""
     
+    # (label, BacktestResult attribute, formatter) for each metric row
+    _METRICS = (
+        ("Total Return", "total_return", "{:.2%}".format),
+        ("Sharpe Ratio", "sharpe_ratio", "{:.2f}".format),
+        ("Calmar Ratio", "calmar_ratio", "{:.2f}".format),
+        ("Max Drawdown", "max_drawdown", "{:.2%}".format),
+    )
+    
     def __init__(self):
         self.console = Console()
     
@@ -60,29 +68,8 @@ class TerminalReporter(BaseReporter):
         baseline = result.baseline_result.primary_result if result.baseline_result and result.baseline_result.primary_result else None
         
         # Core performance metrics
-        table.add_row(
-            "Total Return",
-            f"{candidate.total_return:.2%}" if candidate else "N/A",
-            f"{baseline.total_return:.2%}" if baseline else "N/A"
-        )
-        
-        table.add_row(
-            "Sharpe Ratio",
-            f"{candidate.sharpe_ratio:.2f}" if candidate else "N/A",
-            f"{baseline.sharpe_ratio:.2f}" if baseline else "N/A"
-        )
-        
-        table.add_row(
-            "Calmar Ratio",
-            f"{candidate.calmar_ratio:.2f}" if candidate else "N/A",
-            f"{baseline.calmar_ratio:.2f}" if baseline else "N/A"
-        )
-        
-        table.add_row(
-            "Max Drawdown",
-            f"{candidate.max_drawdown:.2%}" if candidate else "N/A",
-            f"{baseline.max_drawdown:.2%}" if baseline else "N/A"
-        )
+        for row in zip(*self._metric_columns(candidate, baseline)):
+            table.add_row(*row)
         
         # Add verdict row
         verdict_style = "bold green" if "Outperformed" in str(result.comparative_verdict) else "bold red"
@@ -103,10 +90,8 @@ class TerminalReporter(BaseReporter):
         
         candidate = result.candidate_result.primary_result if result.candidate_result else None
         
-        table.add_row("Total Return", f"{candidate.total_return:.2%}" if candidate else "N/A")
-        table.add_row("Sharpe Ratio", f"{candidate.sharpe_ratio:.2f}" if candidate else "N/A")
-        table.add_row("Calmar Ratio", f"{candidate.calmar_ratio:.2f}" if candidate else "N/A")
-        table.add_row("Max Drawdown", f"{candidate.max_drawdown:.2%}" if candidate else "N/A")
+        for row in zip(*self._metric_columns(candidate)):
+            table.add_row(*row)
         
         # Show baseline failure reason if applicable
         if result.baseline_failed:
@@ -118,6 +103,16 @@ class TerminalReporter(BaseReporter):
         
         self.console.print(table)
     
+    def _metric_columns(self, *results) -> List[List[str]]:
+        """Metric labels followed by one formatted column per result; a missing result shows N/A."""
+        columns = [[label for label, _, _ in self._METRICS]]
+        for result in results:
+            if result is None:
+                columns.append(["N/A"] * len(self._METRICS))
+            else:
+                columns.append([fmt(getattr(result, attr)) for _, attr, fmt in self._METRICS])
+        return columns
+    
     def _display_vibe_checks(self, result: ComparativeAnalysisResult) -> None:
         """Display vibe check results for both strategies."""
         # Display candidate vibe checks (existing functionality)
@@ -111,21 +111,21 @@ class AnalysisWorkflow:
 
     def _create_baseline_strategy_config(self, baseline_config) -> StrategyConfig:
         """Create a strategy config for the baseline strategy."""
-        # Create a copy of the main config but with baseline strategy settings
-        baseline_dict = self.config.model_dump()
+        # Remove baseline_config to avoid recursion
+        updates: Dict[str, Any] = {'baseline_config': None}
         
         # Replace strategy-specific settings with baseline
         if baseline_config.strategy_type == "BuyAndHold":
-            baseline_dict['strategy_type'] = "BuyAndHold"
-            baseline_dict['strategy_params'] = {}
+            updates['strategy_type'] = "BuyAndHold"
+            updates['strategy_params'] = {}
         elif baseline_config.strategy_type == "MovingAverageCrossover":
-            baseline_dict['strategy_type'] = "MovingAverageCrossover"
-            baseline_dict['strategy_params'] = baseline_config.params or {}
-        
-        # Remove baseline_config to avoid recursion
-        baseline_dict['baseline_config'] = None
+            updates['strategy_type'] = "MovingAverageCrossover"
+            updates['strategy_params'] = baseline_config.params or {}
         
-        return StrategyConfig(**baseline_dict)
+        # The ticker and dates were validated with the main config, and BaselineConfig has
+        # already validated the strategy type; params are checked by validate_strategy_params
+        # when the backtest runs, so a shallow copy needs no re-validation.
+        return self.config.model_copy(update=updates)
     
     def _create_comparative_result(
         self, 
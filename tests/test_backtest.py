@@ -25,6 +25,7 @@ from src.meqsap.backtest import (
     BacktestAnalysisResult,
     BacktestError
 )
+from src.meqsap.exceptions import BacktestAborted
 from src.meqsap.config import (
     MovingAverageCrossoverParams, StrategyConfig, ConfigurationError, BuyAndHoldParams
 )
@@ -153,6 +154,28 @@ class TestRunBacktest:
         assert isinstance(result.trade_details, list)
         assert isinstance(result.portfolio_value_series, dict)
     
+    def test_run_backtest_trade_dates_are_formatted(self):
+        """Trade timestamps are reported as YYYY-MM-DD strings and durations in whole days."""
+        data, signals = self.create_sample_data_and_signals()
+
+        result = run_backtest(prices_data=data, signals_data=signals)
+
+        assert [(t['entry_date'], t['exit_date']) for t in result.trade_details] == [('2023-01-11', '2023-01-31')]
+        assert result.trade_durations_days == [20]
+        assert result.avg_trade_duration_days == 20.0
+    
+    def test_run_backtest_without_details(self):
+        """Summary-only runs skip the trade details and portfolio value series."""
+        data, signals = self.create_sample_data_and_signals()
+
+        full = run_backtest(prices_data=data, signals_data=signals)
+        summary = run_backtest(prices_data=data, signals_data=signals, include_details=False)
+
+        assert summary.trade_details == []
+        assert summary.portfolio_value_series == {}
+        assert summary.sharpe_ratio == full.sharpe_ratio
+        assert summary.total_trades == full.total_trades
+    
     def test_run_backtest_no_signals(self):
         """Test backtest with no signals."""
         data, signals = self.create_sample_data_and_signals()
@@ -300,6 +323,19 @@ class TestRobustnessChecks:
         assert isinstance(robustness.recommendations, list)
         assert len(robustness.recommendations) > 0
 
+    def test_robustness_checks_reuse_baseline_result(self):
+        """A supplied baseline result is reused; only the high-fee backtest runs."""
+        data, signals = self.create_sample_data_and_signals()
+        config = self.create_sample_config()
+        baseline = run_backtest(prices_data=data, signals_data=signals, fees=0.001)
+
+        with patch('src.meqsap.backtest.run_backtest', wraps=run_backtest) as mock_run:
+            robustness = perform_robustness_checks(data, signals, config, baseline_result=baseline)
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.kwargs['fees'] == 0.01
+        assert robustness == perform_robustness_checks(data, signals, config)
+
 
 class TestCompleteBacktest(unittest.TestCase):
     
@@ -357,6 +393,56 @@ class TestCompleteBacktest(unittest.TestCase):
         self.assertIsInstance(result.primary_result, BacktestResult)
         self.assertIsInstance(result.vibe_checks, VibeCheckResults)
         self.assertIsInstance(result.robustness_checks, RobustnessResults)
+
+    def test_run_complete_backtest_aborted_by_primary_result_callback(self):
+        """A BacktestAborted raised by the callback stops the run before the robustness checks."""
+        strategy_config = StrategyConfig(
+            ticker="AAPL",
+            start_date=date(2020, 1, 1),
+            end_date=date(2021, 1, 1),
+            strategy_type="MovingAverageCrossover",
+            strategy_params={"fast_ma": 5, "slow_ma": 20}
+        )
+        seen = []
+
+        def abort(primary_result):
+            seen.append(primary_result)
+            raise BacktestAborted("stop")
+
+        with patch('src.meqsap.backtest.perform_robustness_checks') as mock_robustness:
+            with self.assertRaises(BacktestAborted):
+                run_complete_backtest(
+                    strategy_config,
+                    {"prices": self.test_data, "signals": self.test_signals},
+                    on_primary_result=abort
+                )
+
+        self.assertIsInstance(seen[0], BacktestResult)
+        mock_robustness.assert_not_called()
+
+    def test_run_complete_backtest_pct_trades_in_target_hold_period(self):
+        """The share of trades held within [min_hold_days, max_hold_days] is recorded."""
+        strategy_config = StrategyConfig(
+            ticker="AAPL",
+            start_date=date(2020, 1, 1),
+            end_date=date(2021, 1, 1),
+            strategy_type="MovingAverageCrossover",
+            strategy_params={"fast_ma": 5, "slow_ma": 20}
+        )
+        primary_result = BacktestResult(
+            total_return=1.0, annualized_return=1.0, sharpe_ratio=1.0, max_drawdown=1.0,
+            total_trades=4, win_rate=50.0, profit_factor=1.0, final_value=10100.0,
+            volatility=1.0, calmar_ratio=1.0, trade_durations_days=[1, 5, 10, 20]
+        )
+
+        with patch('src.meqsap.backtest.run_backtest', return_value=primary_result):
+            result = run_complete_backtest(
+                strategy_config,
+                {"prices": self.test_data, "signals": self.test_signals},
+                objective_params={"min_hold_days": 5, "max_hold_days": 10}
+            )
+
+        self.assertEqual(result.primary_result.pct_trades_in_target_hold_period, 50.0)
         
 class TestErrorHandling(unittest.TestCase):
     """Test error handling in backtest module."""
@@ -95,6 +95,16 @@ def test_cache_hit(mock_yfinance_download, mock_cache):
     mock_save.assert_not_called()
     pd.testing.assert_frame_equal(result, mock_cached_data, check_dtype=False)
 
+def test_force_refresh_bypasses_cache(mock_yfinance_download, mock_cache):
+    mock_load, mock_save = mock_cache
+    mock_yfinance_download.return_value = create_mock_data(date(2023, 1, 1), date(2023, 1, 10))
+    
+    fetch_market_data('AAPL', date(2023, 1, 1), date(2023, 1, 10), force_refresh=True)
+    
+    mock_load.assert_not_called()
+    mock_yfinance_download.assert_called_once()
+    mock_save.assert_called_once()
+
 def test_nan_values_validation(mock_yfinance_download, mock_cache):
     mock_load, _ = mock_cache
     mock_load.side_effect = FileNotFoundError
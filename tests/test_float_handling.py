@@ -156,6 +156,30 @@ class TestFloatConversions(unittest.TestCase):
             self.assertIsNotNone(result)
             self.assertEqual(result.trade_details[0]['pnl'], 0.0) # Assert it defaulted to 0.0
 
+    def test_trades_with_unreadable_timestamps_are_skipped(self):
+        """Trades whose timestamps cannot be parsed are skipped; missing ones read 'N/A'."""
+        mock_portfolio_instance = MagicMock()
+        mock_portfolio_instance.stats.return_value = pd.Series({
+            'Total Return [%]': 10.0, 'Annualized Return [%]': 10.0, 'Sharpe Ratio': 1.0,
+            'Max Drawdown [%]': -5.0, 'End Value': 11000.0, 'Total Trades': 3
+        })
+        mock_portfolio_instance.trades.records_readable = pd.DataFrame({
+            'Entry Time': [pd.Timestamp('2022-01-05'), 'not a date', pd.Timestamp('2022-01-20')],
+            'Exit Time': [pd.Timestamp('2022-01-10'), pd.Timestamp('2022-01-15'), None],
+            'Entry Price': [100.0] * 3, 'Exit Price': [105.0] * 3, 'PnL': [50.0] * 3, 'Return [%]': [5.0] * 3
+        })
+        mock_portfolio_instance.returns.return_value = pd.Series([0.01, 0.02])
+        mock_portfolio_instance.value.return_value = pd.Series({pd.Timestamp('2022-01-01'): 10000.0})
+        mock_portfolio_instance.wrapper.columns = pd.Index(['asset'])
+
+        with patch('src.meqsap.backtest.vbt.Portfolio.from_signals', return_value=mock_portfolio_instance), \
+             self.assertLogs('src.meqsap.backtest', level='WARNING') as logs:
+            result = run_backtest(prices_data=self.test_data['close'], signals_data=self.signals)
+
+        self.assertEqual([(t['entry_date'], t['exit_date']) for t in result.trade_details],
+                         [('2022-01-05', '2022-01-10'), ('2022-01-20', 'N/A')])
+        self.assertTrue(any("Error processing trade at index 1" in line for line in logs.output))
+
 class TestFloatHandling(unittest.TestCase):
     """Test safe float handling in backtesting operations."""
     
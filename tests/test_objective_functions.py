@@ -49,6 +49,11 @@ class TestObjectiveFunctionRegistry:
         with pytest.raises(ConfigurationError):
             get_objective_function("sharpe")
  
+    def test_repeated_lookup_returns_same_function(self):
+        """Test that repeated lookups of a name resolve to the same callable."""
+        assert get_objective_function("SharpeRatio") is get_objective_function("SharpeRatio")
+        assert get_objective_function("SharpeRatio") is maximize_sharpe_ratio
+
     def test_common_lowercase_names_are_handled(self):
         """Test that common lowercase variants are handled correctly."""
         # These should pass due to case-insensitivity
@@ -0,0 +1,671 @@
+import threading
+import time
+
+import pytest
+import optuna
+import pandas as pd
+
+from src.meqsap.config import StrategyConfig
+from src.meqsap.exceptions import BacktestAborted, BacktestError, ConfigurationError
+from src.meqsap.optimizer.engine import OptimizationEngine
+
+
+def _make_engine(algorithm_params=None, strategy_params=None):
+    """Build an engine around a minimal MovingAverageCrossover config."""
+    config = StrategyConfig(
+        ticker="DUMMY",
+        start_date="2023-01-01",
+        end_date="2023-12-31",
+        strategy_type="MovingAverageCrossover",
+        strategy_params=strategy_params or {
+            "fast_ma": {"type": "range", "start": 5, "stop": 15, "step": 5},
+            "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+        },
+    )
+    return OptimizationEngine(
+        strategy_config=config,
+        objective_function=lambda result, params: 0.0,
+        objective_params={},
+        algorithm_params=algorithm_params or {},
+    )
+
+
+class TestSamplerConfiguration:
+    """Test suite for sampler construction from algorithm parameters."""
+
+    def test_tpe_sampler_defaults(self):
+        """TPE sampler uses Optuna's documented defaults when nothing is configured."""
+        sampler = _make_engine({"sampler": "tpe"})._get_sampler()
+
+        assert isinstance(sampler, optuna.samplers.TPESampler)
+        assert sampler._n_startup_trials == 10
+        assert sampler._n_ei_candidates == 24
+        assert sampler._constant_liar is False
+
+    def test_tpe_sampler_honours_algorithm_params(self):
+        """TPE tuning knobs are read from algorithm_params."""
+        engine = _make_engine({
+            "sampler": "tpe",
+            "n_startup_trials": 20,
+            "n_ei_candidates": 48,
+            "constant_liar": True,
+        })
+        sampler = engine._get_sampler()
+
+        assert sampler._n_startup_trials == 20
+        assert sampler._n_ei_candidates == 48
+        assert sampler._constant_liar is True
+
+    def test_tpe_constant_liar_defaults_on_for_parallel_runs(self):
+        """Parallel runs enable the constant liar unless it is configured explicitly."""
+        assert _make_engine({"n_jobs": 4})._get_sampler()._constant_liar is True
+        assert _make_engine({"n_jobs": 4, "constant_liar": False})._get_sampler()._constant_liar is False
+
+    def test_botorch_sampler_without_integration_package(self, mocker):
+        """A missing optuna-integration install surfaces as a configuration error."""
+        class _MissingIntegration:
+            @property
+            def BoTorchSampler(self):
+                raise ModuleNotFoundError("Could not find `optuna-integration`")
+
+        mocker.patch('src.meqsap.optimizer.engine.optuna.integration', new=_MissingIntegration())
+
+        with pytest.raises(ConfigurationError, match="optuna-integration"):
+            _make_engine({"sampler": "botorch"})._get_sampler()
+
+    def test_unknown_sampler_falls_back_to_configured_tpe(self):
+        """An unknown sampler name falls back to the same configured TPE sampler."""
+        sampler = _make_engine({"sampler": "bogus", "n_startup_trials": 3})._get_sampler()
+
+        assert isinstance(sampler, optuna.samplers.TPESampler)
+        assert sampler._n_startup_trials == 3
+
+
+class TestGridSearch:
+    """Test suite for grid search construction."""
+
+    def test_grid_search_space_expands_ranges(self):
+        """Integer ranges expand inclusively to Python ints."""
+        space = _make_engine()._get_grid_search_space()
+
+        assert space == {"fast_ma": [5, 10, 15], "slow_ma": [20, 30]}
+        assert all(type(value) is int for value in space["fast_ma"])
+
+    def test_grid_search_space_is_built_once(self, mocker):
+        """Later lookups reuse the expanded space instead of expanding the ranges again."""
+        engine = _make_engine()
+        expand = mocker.spy(engine._param_parsers[0], 'for_grid_search')
+
+        assert engine._get_grid_search_space() is engine._get_grid_search_space()
+        assert expand.call_count == 1
+
+    def test_only_feasible_grid_points_are_enqueued(self):
+        """Grid cells with fast_ma >= slow_ma are never queued, and the run is capped."""
+        engine = _make_engine(strategy_params={
+            "fast_ma": {"type": "range", "start": 10, "stop": 30, "step": 10},
+            "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+        })
+        engine._total_trials = 100
+        study = optuna.create_study(sampler=engine._get_sampler())
+
+        engine._enqueue_feasible_grid(study)
+
+        queued = [t.system_attrs["fixed_params"] for t in study.get_trials(states=(optuna.trial.TrialState.WAITING,))]
+        assert queued == [{"fast_ma": 10, "slow_ma": 20}, {"fast_ma": 10, "slow_ma": 30}, {"fast_ma": 20, "slow_ma": 30}]
+        assert engine._total_trials == 3
+
+    def test_finished_grid_points_are_not_queued_again(self):
+        """A resumed grid search only queues the feasible points it has not finished."""
+        engine = _make_engine(strategy_params={
+            "fast_ma": {"type": "range", "start": 10, "stop": 30, "step": 10},
+            "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+        })
+        engine._total_trials = 100
+        study = optuna.create_study(sampler=engine._get_sampler())
+        distribution = optuna.distributions.IntDistribution(10, 30, step=10)
+        study.add_trial(optuna.trial.create_trial(
+            params={"fast_ma": 10, "slow_ma": 20},
+            distributions={"fast_ma": distribution, "slow_ma": distribution},
+            value=1.0,
+        ))
+
+        engine._enqueue_feasible_grid(study)
+
+        queued = [t.system_attrs["fixed_params"] for t in study.get_trials(states=(optuna.trial.TrialState.WAITING,))]
+        assert queued == [{"fast_ma": 10, "slow_ma": 30}, {"fast_ma": 20, "slow_ma": 30}]
+        assert engine._total_trials == 2
+
+    def test_fully_feasible_grid_caps_trials_at_grid_size(self):
+        """Without infeasible cells nothing is queued, but the run stops at the grid size."""
+        engine = _make_engine()
+        engine._total_trials = 100
+        study = optuna.create_study(sampler=engine._get_sampler())
+
+        engine._enqueue_feasible_grid(study)
+
+        assert study.get_trials(states=(optuna.trial.TrialState.WAITING,)) == []
+        assert engine._total_trials == 6
+
+    def test_enqueued_grid_points_keep_python_values(self):
+        """Points filtered as columns are queued with the original values, choices included."""
+        engine = _make_engine(strategy_params={
+            "fast_ma": {"type": "range", "start": 10, "stop": 20, "step": 10},
+            "slow_ma": {"type": "choices", "values": [10, 20]},
+            "mode": {"type": "choices", "values": ["a", 1.5]},
+        })
+        engine._total_trials = 100
+        study = optuna.create_study(sampler=engine._get_sampler())
+
+        engine._enqueue_feasible_grid(study)
+
+        queued = [t.system_attrs["fixed_params"] for t in study.get_trials(states=(optuna.trial.TrialState.WAITING,))]
+        assert queued == [{"fast_ma": 10, "slow_ma": 20, "mode": "a"}, {"fast_ma": 10, "slow_ma": 20, "mode": 1.5}]
+        assert [type(params["mode"]) for params in queued] == [str, float]
+
+
+class TestDirection:
+    """Test suite for optimization direction handling."""
+
+    def test_invalid_direction_fails_at_construction(self):
+        """A bad direction is reported when the engine is built, not when it runs."""
+        with pytest.raises(ConfigurationError, match="Invalid optimization direction"):
+            _make_engine({"direction": "sideways"})
+
+
+class TestBacktestWarmUp:
+    """Test suite for the pre-optimization backtest warm-up."""
+
+    def test_warm_up_runs_optimized_strategy_at_first_feasible_point(self, mocker):
+        """Warm-up backtests the real strategy with one concrete, feasible parameter set."""
+        mock_backtest = mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        market_data = pd.DataFrame({"close": range(100)})
+        engine = _make_engine(strategy_params={
+            "fast_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+            "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+        })
+
+        engine._warm_up_backtest(market_data)
+
+        warmup_config, warmup_data = mock_backtest.call_args[0]
+        assert warmup_config.strategy_type == "MovingAverageCrossover"
+        assert warmup_config.strategy_params == {"fast_ma": 20, "slow_ma": 30}
+        assert warmup_data is market_data
+
+    def test_warm_up_skipped_without_feasible_point(self, mocker):
+        """No backtest runs when no grid point satisfies the constraints."""
+        mock_backtest = mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        engine = _make_engine(strategy_params={"fast_ma": 30, "slow_ma": 20})
+
+        engine._warm_up_backtest(pd.DataFrame({"close": range(100)}))
+
+        mock_backtest.assert_not_called()
+
+    def test_warm_up_failure_is_swallowed(self, mocker):
+        """A failing warm-up must never abort the optimization run."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest', side_effect=BacktestError("boom"))
+
+        _make_engine()._warm_up_backtest(pd.DataFrame({"close": range(10)}))
+
+
+class TestTrialStorage:
+    """Test suite for the SQLite trial storage."""
+
+    def test_trials_are_kept_in_memory_by_default(self):
+        """Without a storage setting no database is used."""
+        assert _make_engine()._create_storage() is None
+
+    def test_storage_path_uses_journal_file(self, tmp_path):
+        """A plain path selects the append-only journal storage."""
+        storage = _make_engine({"storage": str(tmp_path / "trials.log")})._create_storage()
+
+        assert isinstance(storage, optuna.storages.JournalStorage)
+
+    def test_sqlite_storage_uses_wal_journal(self, tmp_path):
+        """Connections handed out by a SQLite storage run in WAL mode."""
+        storage = _make_engine({"storage": f"sqlite:///{tmp_path / 'trials.db'}"})._create_storage()
+
+        with storage.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+    def test_named_study_resumes_stored_trials(self, mocker, tmp_path):
+        """A second run with the same study name continues the stored study."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        params = {"storage": str(tmp_path / "trials.log"), "study_name": "resume", "sampler": "random"}
+        studies = []
+        for _ in range(2):
+            engine = _make_engine(params)
+            mocker.patch.object(engine, '_warm_up_backtest')
+            studies.append(engine._start_run(None, None, None, 3))
+            studies[-1].optimize(lambda trial: engine._run_single_trial(trial, None), n_trials=3)
+
+        assert studies[1].study_name == "resume"
+        assert len(studies[1].trials) == 6
+        assert engine._compile_results(studies[1]).best_score == studies[1].best_value
+
+    def test_resumed_study_seeds_score_cache(self, mocker, tmp_path):
+        """Combinations scored in an earlier run are reused instead of backtested again."""
+        mock_backtest = mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        params = {"storage": str(tmp_path / "trials.log"), "study_name": "cache"}
+        first = _make_engine(params)
+        first.objective_function = lambda result, objective_params: 0.5
+        mocker.patch.object(first, '_warm_up_backtest')
+        first._start_run(None, None, None, 1).optimize(
+            lambda trial: first._run_single_trial(trial, None), n_trials=1
+        )
+        stored_params = dict(first._best_params)
+
+        second = _make_engine(params)
+        second.objective_function = first.objective_function
+        mocker.patch.object(second, '_warm_up_backtest')
+        second._start_run(None, None, None, 1)
+
+        assert second._evaluate_trial(mocker.Mock(number=1), stored_params, None) == 0.5
+        assert mock_backtest.call_count == 1
+
+
+    def test_resumed_study_on_changed_data_reruns_backtests(self, mocker, tmp_path):
+        """Scores stored for other market data are not reused when the study is resumed."""
+        mock_backtest = mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        params = {"storage": str(tmp_path / "trials.log"), "study_name": "changed"}
+        first = _make_engine(params)
+        mocker.patch.object(first, '_warm_up_backtest')
+        first._start_run(pd.DataFrame({"close": range(10)}), None, None, 1).optimize(
+            lambda trial: first._run_single_trial(trial, None), n_trials=1
+        )
+        stored_params = dict(first._best_params)
+
+        second = _make_engine(params)
+        mocker.patch.object(second, '_warm_up_backtest')
+        second._start_run(pd.DataFrame({"close": range(1, 11)}), None, None, 1)
+        second._evaluate_trial(mocker.Mock(number=1), stored_params, None)
+
+        assert not second._resumed_study
+        assert mock_backtest.call_count == 2
+
+    def test_resumed_best_trial_keeps_fixed_params(self, mocker, tmp_path):
+        """A best trial from an earlier run is reported with its fixed parameters."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        params = {"storage": str(tmp_path / "trials.log"), "study_name": "fixed"}
+        strategy_params = {"fast_ma": 5, "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10}}
+        first = _make_engine(params, strategy_params)
+        first.objective_function = lambda result, objective_params: 0.5
+        mocker.patch.object(first, '_warm_up_backtest')
+        first._start_run(None, None, None, 1).optimize(
+            lambda trial: first._run_single_trial(trial, None), n_trials=1
+        )
+
+        second = _make_engine(params, strategy_params)
+        second.objective_function = first.objective_function
+        mocker.patch.object(second, '_warm_up_backtest')
+        result = second._compile_results(second._start_run(None, None, None, 1))
+
+        assert result.best_params == first._best_params
+        assert result.best_params["fast_ma"] == 5
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize("stored_params", [
+        {"fast_ma": 40, "slow_ma": 20},  # outside the range
+        {"fast_ma": 7, "slow_ma": 20},  # off the step grid
+        {"slow_ma": 20},  # missing
+    ])
+    def test_replay_rejects_params_outside_current_space(self, stored_params):
+        """Stored values that no longer fit the parameter definitions cannot be replayed."""
+        with pytest.raises(ValueError):
+            _make_engine()._replay_params(stored_params)
+
+    def test_study_name_requires_storage(self):
+        """A named study without storage would silently start empty, so it is rejected."""
+        with pytest.raises(ConfigurationError, match="study_name requires storage"):
+            _make_engine({"study_name": "resume"})
+
+
+class TestParallelTrials:
+    """Test suite for running trials on several threads."""
+
+    def test_n_jobs_is_passed_to_study_optimize(self, mocker):
+        """The n_jobs algorithm parameter is forwarded to Optuna."""
+        mock_study = mocker.Mock()
+        mocker.patch('src.meqsap.optimizer.engine.optuna.create_study', return_value=mock_study)
+        engine = _make_engine({"n_jobs": 4})
+        mocker.patch.object(engine, '_warm_up_backtest')
+        mocker.patch.object(engine, '_create_storage')
+        mocker.patch.object(engine, '_compile_results')
+
+        engine.run_optimization(pd.DataFrame({"close": range(10)}), n_trials=8)
+
+        assert mock_study.optimize.call_args.kwargs["n_jobs"] == 4
+
+    def test_n_jobs_minus_one_uses_every_cpu(self, mocker):
+        """n_jobs=-1 resolves to the CPU count, which also turns on TPE's constant liar."""
+        mocker.patch('src.meqsap.optimizer.engine.os.cpu_count', return_value=4)
+        engine = _make_engine({"n_jobs": -1, "sampler": "tpe"})
+
+        assert engine._n_jobs == 4
+        assert engine._get_sampler()._constant_liar
+
+    @pytest.mark.parametrize("n_jobs", [0, -2, 1.5])
+    def test_invalid_n_jobs_is_rejected(self, n_jobs):
+        """Worker counts other than positive integers and -1 are configuration errors."""
+        with pytest.raises(ConfigurationError, match="n_jobs"):
+            _make_engine({"n_jobs": n_jobs})
+
+    def test_counters_are_consistent_under_threads(self, mocker):
+        """Concurrent trials neither lose nor double-count trial outcomes."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        engine = _make_engine()
+        study = optuna.create_study(direction="maximize")
+
+        study.optimize(lambda trial: engine._run_single_trial(trial, None), n_trials=40, n_jobs=4)
+
+        completed = [t for t in study.trials if t.state == optuna.trial.TrialState.COMPLETE]
+        assert engine._current_trial == 40
+        assert engine._successful_trials == len(completed)
+
+
+class TestBatchedOptimization:
+    """Test suite for the ask-and-tell batched optimization loop."""
+
+    def test_batched_run_completes_all_trials(self, mocker):
+        """Every asked trial is told back, with invalid MA pairs recorded as pruned."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        engine = _make_engine({"sampler": "random", "random_seed": 0, "n_jobs": 2})
+        study = optuna.create_study(direction="maximize")
+        mocker.patch('src.meqsap.optimizer.engine.optuna.create_study', return_value=study)
+        mocker.patch.object(engine, '_create_storage')
+        mocker.patch.object(engine, '_compile_results')
+
+        engine.run_optimization_batched(pd.DataFrame({"close": range(10)}), batch_size=4, n_trials=10)
+
+        states = [t.state for t in study.trials]
+        assert len(states) == 10
+        assert optuna.trial.TrialState.RUNNING not in states
+        assert engine._current_trial == 10
+        assert engine._successful_trials == states.count(optuna.trial.TrialState.COMPLETE)
+
+    def test_batched_run_sizes_batches_to_the_timeout(self, mocker):
+        """Batches shrink to what fits before the deadline instead of overshooting it."""
+        engine = _make_engine({"sampler": "random", "random_seed": 0, "timeout": 0.5})
+        study = optuna.create_study(direction="maximize")
+        mocker.patch('src.meqsap.optimizer.engine.optuna.create_study', return_value=study)
+        mocker.patch.object(engine, '_create_storage')
+        mocker.patch.object(engine, '_warm_up_backtest')
+        mocker.patch.object(engine, '_compile_results')
+
+        def slow_trial(*args):
+            time.sleep(0.05)
+            return 1.0, optuna.trial.TrialState.COMPLETE
+
+        mocker.patch.object(engine, '_evaluate_trial_for_tell', side_effect=slow_trial)
+
+        start = time.monotonic()
+        engine.run_optimization_batched(pd.DataFrame({"close": range(10)}), batch_size=100, n_trials=100)
+
+        assert len(study.trials) < 100
+        assert time.monotonic() - start < 1.0
+
+    def test_batched_run_rejects_empty_batches(self):
+        """A non-positive batch size is a configuration error."""
+        with pytest.raises(ConfigurationError):
+            _make_engine().run_optimization_batched(pd.DataFrame(), batch_size=0)
+
+
+class TestTrialConfig:
+    """Test suite for per-trial strategy config construction."""
+
+    def test_config_for_params_only_replaces_strategy_params(self):
+        """Trial configs share every field but strategy_params with the base config."""
+        engine = _make_engine()
+
+        trial_config = engine._config_for_params({"fast_ma": 5, "slow_ma": 20})
+
+        assert isinstance(trial_config, StrategyConfig)
+        assert trial_config.strategy_params == {"fast_ma": 5, "slow_ma": 20}
+        assert trial_config.model_dump(exclude={"strategy_params"}) == \
+            engine.strategy_config.model_dump(exclude={"strategy_params"})
+        assert engine.strategy_config.strategy_params["fast_ma"]["type"] == "range"
+
+    def test_invalid_trial_params_still_fail_the_trial(self, mocker):
+        """Skipping revalidation must not let invalid parameters through signal generation."""
+        engine = _make_engine()
+        mocker.patch.object(engine, '_record_failure')
+        trial = mocker.Mock(number=0, params={})
+
+        score = engine._evaluate_trial(trial, {"fast_ma": -5, "slow_ma": 20}, pd.DataFrame({"close": range(50)}))
+
+        assert score == float("-inf")
+        engine._record_failure.assert_called_once()
+
+
+class TestParameterSuggestion:
+    """Test suite for per-trial parameter suggestion."""
+
+    def test_suggestion_reuses_parsers_built_at_init(self, mocker):
+        """Parameter definitions are parsed once per engine, not once per trial."""
+        engine = _make_engine(strategy_params={
+            "fast_ma": {"type": "range", "start": 5, "stop": 15, "step": 5},
+            "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+            "label": {"type": "choices", "values": ["a", "b"]},
+            "fixed": {"type": "value", "value": 1.5},
+        })
+        parser_cls = mocker.patch('src.meqsap.optimizer.engine._ParameterParser')
+
+        params = engine._suggest_params_for_trial(
+            optuna.trial.FixedTrial({"fast_ma": 10, "slow_ma": 30, "label": "b"})
+        )
+
+        assert params == {"fast_ma": 10, "slow_ma": 30, "label": "b", "fixed": 1.5}
+        parser_cls.assert_not_called()
+
+    def test_infeasible_ma_pair_is_recorded_as_constraint_and_pruned(self):
+        """fast_ma >= slow_ma is reported to the sampler as a violated constraint."""
+        engine = _make_engine(strategy_params={
+            "fast_ma": {"type": "range", "start": 5, "stop": 30, "step": 5},
+            "slow_ma": {"type": "range", "start": 20, "stop": 30, "step": 10},
+        })
+        study = optuna.create_study()
+        study.enqueue_trial({"fast_ma": 25, "slow_ma": 20})
+        trial = study.ask()
+
+        with pytest.raises(optuna.TrialPruned):
+            engine._suggest_params_for_trial(trial)
+        study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+
+        assert study.trials[0].constraints == {"fast_ma_below_slow_ma": 6.0}
+
+    def test_float_range_is_suggested_as_float(self):
+        """Non-integer ranges go through suggest_float."""
+        engine = _make_engine(strategy_params={
+            "threshold": {"type": "range", "start": 0.1, "stop": 0.5, "step": 0.1},
+        })
+
+        params = engine._suggest_params_for_trial(optuna.trial.FixedTrial({"threshold": 0.3}))
+
+        assert params == {"threshold": 0.3}
+
+
+class TestResultCompilation:
+    """Test suite for compiling the final optimization result."""
+
+    def test_best_analysis_is_reused_without_rerun(self, mocker):
+        """The best trial's analysis is kept from the trial itself, not re-run."""
+        analysis = mocker.Mock()
+        analysis.model_dump.return_value = {"primary_result": {}}
+        mock_backtest = mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest', return_value=analysis)
+        engine = _make_engine()
+        engine.objective_function = lambda result, params: 1.0
+        study = optuna.create_study(direction="maximize")
+        study.optimize(lambda trial: engine._run_single_trial(trial, pd.DataFrame()), n_trials=1)
+        engine._market_data = pd.DataFrame()
+
+        result = engine._compile_results(study)
+
+        assert mock_backtest.call_count == 1
+        assert result.best_strategy_analysis == {"primary_result": {}}
+
+    def test_no_successful_trial_leaves_best_empty(self, mocker):
+        """A run without a successful trial compiles without querying the study."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest', side_effect=BacktestError("boom"))
+        engine = _make_engine()
+        study = optuna.create_study(direction="maximize")
+        study.optimize(lambda trial: engine._run_single_trial(trial, pd.DataFrame()), n_trials=2)
+
+        result = engine._compile_results(study)
+
+        assert result.best_params is None
+        assert result.best_score is None
+
+    def test_best_score_follows_minimize_direction(self, mocker):
+        """With direction=minimize the lowest score is tracked as best."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        engine = _make_engine({"direction": " Minimize "})
+        scores = iter([3.0, 1.0, 2.0])
+        engine.objective_function = lambda result, params: next(scores)
+
+        for number in range(3):
+            engine._evaluate_trial(mocker.Mock(number=number), {"fast_ma": 5 + number, "slow_ma": 20}, None)
+
+        assert engine._best_score == 1.0
+        assert engine._best_trial_number == 1
+
+
+class TestDuplicateTrials:
+    """Test suite for reusing scores of repeated parameter combinations."""
+
+    def test_repeated_params_skip_the_backtest(self, mocker):
+        """A repeated combination returns the earlier score without backtesting again."""
+        mock_backtest = mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        engine = _make_engine()
+        engine.objective_function = mocker.Mock(return_value=0.7)
+        params = {"fast_ma": 5, "slow_ma": 20}
+
+        scores = [engine._evaluate_trial(mocker.Mock(number=n), dict(params), None) for n in range(3)]
+
+        assert scores == [0.7, 0.7, 0.7]
+        assert mock_backtest.call_count == 1
+        assert engine._successful_trials == 3
+        assert engine._best_trial_number == 0
+
+    def test_failed_params_are_retried(self, mocker):
+        """Failures are not cached, so a repeat runs the backtest again."""
+        mock_backtest = mocker.patch(
+            'src.meqsap.optimizer.engine.run_complete_backtest', side_effect=BacktestError("boom")
+        )
+        engine = _make_engine()
+        params = {"fast_ma": 5, "slow_ma": 20}
+
+        for n in range(2):
+            engine._evaluate_trial(mocker.Mock(number=n), dict(params), None)
+
+        assert mock_backtest.call_count == 2
+
+
+class TestProgressThrottling:
+    """Test suite for coalescing progress callbacks."""
+
+    def test_updates_within_interval_are_coalesced(self, mocker):
+        """Only the first of several rapid updates reaches the callback."""
+        callback = mocker.Mock()
+        engine = _make_engine({"progress_interval": 60})
+        engine._progress_callback = callback
+        engine._total_trials = 10
+
+        for trial in range(1, 4):
+            engine._current_trial = trial
+            engine._update_progress({})
+
+        assert callback.call_count == 1
+
+    def test_final_trial_always_reported(self, mocker):
+        """Once all trials have started, updates are never dropped."""
+        callback = mocker.Mock()
+        engine = _make_engine({"progress_interval": 60})
+        engine._progress_callback = callback
+        engine._total_trials = 2
+
+        engine._current_trial = 1
+        engine._update_progress({})
+        engine._current_trial = 2
+        engine._update_progress({})
+
+        assert callback.call_count == 2
+        assert callback.call_args[0][0].current_trial == 2
+
+    def test_compiling_results_reports_final_state(self, mocker):
+        """A run that stops early still delivers its last progress update."""
+        callback = mocker.Mock()
+        engine = _make_engine({"progress_interval": 60})
+        engine._progress_callback = callback
+        engine._total_trials = 10
+
+        engine._current_trial = 1
+        engine._update_progress({})
+        engine._current_trial = 4
+        engine._update_progress({})
+        engine._compile_results(optuna.create_study(direction="maximize"))
+
+        assert callback.call_count == 2
+        assert callback.call_args[0][0].current_trial == 4
+
+    def test_callback_runs_outside_state_lock(self, mocker):
+        """Workers are not blocked on the state lock while the callback renders."""
+        lock_held = []
+        engine = _make_engine()
+        engine._progress_callback = lambda progress: lock_held.append(engine._state_lock.locked())
+        engine._total_trials = 1
+        engine._current_trial = 1
+
+        engine._update_progress({})
+
+        assert lock_held == [False]
+
+
+class TestInterruption:
+    """Test suite for the per-trial interruption check."""
+
+    def test_set_event_prunes_new_trials(self, mocker):
+        """Once the registered event is set, new trials are pruned before suggesting."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest')
+        engine = _make_engine()
+        mocker.patch.object(engine, '_warm_up_backtest')
+        mocker.patch.object(engine, '_compile_results')
+        event = threading.Event()
+        event.set()
+        study = optuna.create_study()
+        mocker.patch('src.meqsap.optimizer.engine.optuna.create_study', return_value=study)
+
+        engine.run_optimization(pd.DataFrame(), interruption_event=event, n_trials=3)
+
+        assert engine._current_trial == 0
+        assert all(t.state == optuna.trial.TrialState.PRUNED for t in study.trials)
+
+
+class TestPruning:
+    """Test suite for reporting preliminary scores to the pruner."""
+
+    def test_no_reporter_without_configured_pruner(self, mocker):
+        """Without a pruner trials are never reported, so Optuna's default pruner stays inert."""
+        assert _make_engine()._pruning_reporter(mocker.Mock()) is None
+
+    def test_reporter_aborts_trial_the_pruner_rejects(self, mocker):
+        """The primary-result score is reported, and a prune decision aborts the backtest."""
+        engine = _make_engine()
+        engine._pruning_enabled = True
+        engine.objective_function = lambda result, params: result.primary_result.sharpe_ratio
+        trial = mocker.Mock()
+        trial.should_prune.return_value = True
+
+        with pytest.raises(BacktestAborted):
+            engine._pruning_reporter(trial)(mocker.Mock(sharpe_ratio=0.5))
+
+        trial.report.assert_called_once_with(0.5, step=1)
+
+    def test_aborted_backtest_prunes_the_trial(self, mocker):
+        """An aborted backtest becomes a pruned trial, not a recorded failure."""
+        mocker.patch('src.meqsap.optimizer.engine.run_complete_backtest', side_effect=BacktestAborted("pruned"))
+        engine = _make_engine()
+        mocker.patch.object(engine, '_record_failure')
+
+        with pytest.raises(optuna.TrialPruned):
+            engine._evaluate_trial(mocker.Mock(number=0), {"fast_ma": 5, "slow_ma": 20}, None)
+
+        engine._record_failure.assert_not_called()
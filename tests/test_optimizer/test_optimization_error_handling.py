@@ -82,17 +82,17 @@ class TestOptimizationErrorHandling:
         
         # Check logging
         if isinstance(exception_type, (DataError, BacktestError, ConfigurationError)):
-            # The first log is INFO "Starting trial...", the second is WARNING for the error
+            # The trial start is logged at DEBUG, the error itself as a WARNING
             warning_logs = [rec for rec in caplog.records 
                           if rec.levelname == 'WARNING' and rec.name == "src.meqsap.optimizer.engine"]
             assert len(warning_logs) >= 1
             assert expected_failure_type.value in warning_logs[0].message
         else:
-            # The first log is INFO, the second is DEBUG for the unexpected error
+            # Both the trial start and the unexpected error are logged at DEBUG
             debug_logs = [rec for rec in caplog.records 
                          if rec.levelname == 'DEBUG' and rec.name == "src.meqsap.optimizer.engine"]
             assert len(debug_logs) >= 1
-            assert "failed with unexpected error" in debug_logs[0].message
+            assert any("failed with unexpected error" in rec.message for rec in debug_logs)
     
     def test_successful_trial(self, mock_engine, mocker):
         """Test successful trial execution."""
@@ -138,17 +138,20 @@ class TestOptimizationErrorHandling:
     
     def test_progress_callback_invocation(self, mock_engine):
         """Test that progress callback is called with correct data."""
+        # Record failures before a callback is attached
+        mock_engine._record_failure(TrialFailureType.DATA_ERROR, {})
+        mock_engine._record_failure(TrialFailureType.DATA_ERROR, {})
+
         # Setup mock callback
         mock_callback = Mock()
         mock_engine._progress_callback = mock_callback
         mock_engine._start_time = 100
         mock_engine._best_score = 1.5
         mock_engine._total_trials = 10
-        mock_engine._failed_trials_by_type[TrialFailureType.DATA_ERROR] = 2
         mock_engine._current_trial = 1  # Simulate being in the first trial
         
-        # Mock time.time
-        with patch('time.time', return_value=150):
+        # Mock the monotonic clock
+        with patch('time.monotonic', return_value=150):
             params = {"fast_ma": 15}
             mock_engine._update_progress(params)
         
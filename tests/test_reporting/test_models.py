@@ -84,6 +84,21 @@ class TestComparativeAnalysisResult:
                 comparative_verdict="Outperformed"
             )
     
+    def test_validation_unknown_verdict(self, mock_candidate_result, mock_baseline_result):
+        """Test verdicts outside the allowed values are rejected."""
+        with pytest.raises(ValidationError, match="comparative_verdict"):
+            ComparativeAnalysisResult(
+                candidate_result=mock_candidate_result,
+                baseline_result=mock_baseline_result,
+                comparative_verdict="Tied"
+            )
+    
+    def test_result_is_immutable(self, mock_candidate_result):
+        """Test fields cannot be reassigned after validation."""
+        result = ComparativeAnalysisResult(candidate_result=mock_candidate_result)
+        with pytest.raises(ValidationError):
+            result.baseline_failed = True
+    
     def test_format_verdict(self, mock_candidate_result, mock_baseline_result):
         """Test verdict formatting."""
         result = ComparativeAnalysisResult(
@@ -95,3 +110,29 @@ class TestComparativeAnalysisResult:
         formatted = result.format_verdict()
         assert "Strategy Outperformed baseline" in formatted
         assert "Sharpe Ratio" in formatted
+    
+    def test_format_verdict_without_comparison(self, mock_candidate_result, mock_baseline_result):
+        """Test verdict text when there is no baseline or no verdict."""
+        no_baseline = ComparativeAnalysisResult(candidate_result=mock_candidate_result)
+        inconclusive = ComparativeAnalysisResult(
+            candidate_result=mock_candidate_result,
+            baseline_result=mock_baseline_result
+        )
+        
+        assert no_baseline.format_verdict() == "No baseline comparison available"
+        assert inconclusive.format_verdict() == "Comparison inconclusive"
+    
+    def test_display_state_follows_model_copy(self, mock_candidate_result, mock_baseline_result):
+        """Test copies made with model_copy(update=...) report their own fields."""
+        result = ComparativeAnalysisResult(
+            candidate_result=mock_candidate_result,
+            baseline_result=mock_baseline_result,
+            comparative_verdict="Outperformed"
+        )
+        
+        underperformed = result.model_copy(update={"comparative_verdict": "Underperformed"})
+        without_baseline = result.model_copy(update={"baseline_result": None, "comparative_verdict": None})
+        
+        assert "Strategy Underperformed baseline" in underperformed.format_verdict()
+        assert not without_baseline.has_baseline
+        assert without_baseline.format_verdict() == "No baseline comparison available"
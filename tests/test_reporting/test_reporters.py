@@ -65,6 +65,15 @@ class TestTerminalReporter:
         args, kwargs = mock_print.call_args
         assert "Strategy Performance Analysis" in str(args[0].title)
 
+    @patch('rich.console.Console.print')
+    def test_comparative_table_cells(self, mock_print, mock_comparative_result):
+        reporter = TerminalReporter()
+        reporter.generate_report(mock_comparative_result)
+        table = mock_print.call_args[0][0]
+        assert table.columns[0]._cells[:4] == ["Total Return", "Sharpe Ratio", "Calmar Ratio", "Max Drawdown"]
+        assert table.columns[1]._cells[:4] == ["15.00%", "1.20", "0.80", "-10.00%"]
+        assert table.columns[2]._cells[:4] == ["10.00%", "0.90", "0.60", "-15.00%"]
+
 class TestHtmlReporter:
     @patch('quantstats.reports.html')
     def test_generate_report_comparative(self, mock_qs_html, mock_comparative_result):
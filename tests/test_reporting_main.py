@@ -27,6 +27,8 @@ from src.meqsap.reporting import (
     format_number,
     get_performance_color,
     format_performance_metrics,
+    format_performance_metrics_batch,
+    performance_metric_values,
     determine_overall_verdict,
     create_strategy_summary_table,
     create_performance_table,
@@ -36,6 +38,7 @@ from src.meqsap.reporting import (
     generate_executive_verdict,
     prepare_returns_for_pyfolio,
     generate_pdf_report,
+    generate_pdf_reports,
     generate_complete_report,
     PYFOLIO_AVAILABLE
 )
@@ -280,6 +283,26 @@ class TestFormatPerformanceMetrics:
         assert formatted["total_return"] == "N/A"
         assert formatted["annual_return"] == "N/A"
         assert formatted["sharpe_ratio"] == "N/A"
+    
+    @pytest.mark.parametrize("decimal_places", [1, 2])
+    def test_format_performance_metrics_batch_matches_per_result(self, decimal_places):
+        """Test the batch formatter produces the same strings as the per-result one."""
+        edge = BacktestResult(
+            total_return=np.nan, annualized_return=np.inf, sharpe_ratio=-np.inf,
+            max_drawdown=-0.004, total_trades=0, win_rate=0.0, profit_factor=0.0,
+            final_value=1234567.891, volatility=0.0, calmar_ratio=-1.25
+        )
+        primaries = [self.create_sample_backtest_result(), edge]
+        analyses = [
+            MagicMock(primary_result=primary, strategy_config={"strategy_type": name})
+            for primary, name in zip(primaries, ["sample", "edge"])
+        ]
+        
+        frame = format_performance_metrics_batch(analyses, decimal_places=decimal_places)
+        
+        assert list(frame.index) == ["sample", "edge"]
+        for name, primary in zip(frame.index, primaries):
+            assert frame.loc[name].to_dict() == format_performance_metrics(primary, decimal_places=decimal_places)
 
 
 class TestOverallVerdictLogic:
@@ -447,6 +470,30 @@ class TestTableCreation:
         assert table.title == "Performance Metrics"
         assert len(table.columns) == 2
     
+    def test_create_performance_table_with_baseline(self):
+        """Test differences are computed from raw values and from formatted strings alike."""
+        candidate = self.create_sample_backtest_result()
+        baseline = self.create_sample_backtest_result()
+        baseline.total_return = 10.5
+        baseline.sharpe_ratio = 1.0
+        baseline.total_trades = 40
+        
+        candidate_metrics = format_performance_metrics(candidate)
+        baseline_metrics = format_performance_metrics(baseline)
+        
+        from_values = create_performance_table(
+            candidate_metrics, baseline_metrics,
+            candidate_values=performance_metric_values(candidate),
+            baseline_values=performance_metric_values(baseline)
+        )
+        from_strings = create_performance_table(candidate_metrics, baseline_metrics)
+        
+        for table in (from_values, from_strings):
+            diffs = dict(zip(table.columns[0]._cells, table.columns[3]._cells))
+            assert diffs["Total Return"] == "+5.00%"
+            assert diffs["Sharpe Ratio"] == "+0.25"
+            assert diffs["Total Trades"] == "+5"
+    
     def test_create_performance_table_no_color(self):
         """Test performance table creation without colors."""
         backtest_result = self.create_sample_backtest_result()
@@ -654,6 +701,24 @@ class TestPyfolioIntegration:
         with pytest.raises(ReportingError, match="No portfolio value series available"):
             prepare_returns_for_pyfolio(backtest_result)
     
+    def test_pyfolio_returns_are_cached_per_result(self):
+        """Test repeated exports reuse the returns until the series changes."""
+        from src.meqsap.reporting.format_utils import _cached_pyfolio_returns
+        backtest_result = self.create_sample_backtest_result_with_series()
+        
+        first = _cached_pyfolio_returns(backtest_result)
+        assert _cached_pyfolio_returns(backtest_result) is first
+        
+        # An in-place edit of the same length must not serve stale returns
+        last_date = list(backtest_result.portfolio_value_series)[-1]
+        backtest_result.portfolio_value_series[last_date] *= 2
+        edited = _cached_pyfolio_returns(backtest_result)
+        assert edited is not first
+        assert edited.iloc[-1] != first.iloc[-1]
+        
+        backtest_result.portfolio_value_series = dict(list(backtest_result.portfolio_value_series.items())[:50])
+        assert len(_cached_pyfolio_returns(backtest_result)) == 49
+    
     @patch('src.meqsap.reporting.PYFOLIO_AVAILABLE', False)
     def test_generate_pdf_report_no_pyfolio(self):
         """Test PDF generation when pyfolio is not available."""
@@ -680,6 +745,26 @@ class TestPyfolioIntegration:
         with pytest.raises(ReportingError, match="PDF report generation requires pyfolio"):
             generate_pdf_report(analysis_result, "dummy_path.pdf")
     
+    def test_generate_pdf_reports_single_result_runs_in_process(self, tmp_path):
+        """Test a one-result batch skips the process pool and names the report."""
+        analysis_result = MagicMock(strategy_config={"strategy_type": "MovingAverageCrossover"})
+        
+        with patch('src.meqsap.reporting.format_utils.PYFOLIO_AVAILABLE', True), \
+             patch('src.meqsap.reporting.format_utils.generate_pdf_report') as mock_generate, \
+             patch('src.meqsap.reporting.format_utils.ProcessPoolExecutor') as mock_pool:
+            mock_generate.side_effect = lambda result, path: path
+            
+            paths = generate_pdf_reports([analysis_result], tmp_path)
+        
+        assert paths == [tmp_path / "000_MovingAverageCrossover.pdf"]
+        mock_pool.assert_not_called()
+    
+    @patch('src.meqsap.reporting.format_utils.PYFOLIO_AVAILABLE', False)
+    def test_generate_pdf_reports_no_pyfolio(self, tmp_path):
+        """Test batch PDF generation fails up front when pyfolio is not available."""
+        with pytest.raises(ReportingError, match="PDF report generation requires pyfolio"):
+            generate_pdf_reports([MagicMock(), MagicMock()], tmp_path)
+    
     @pytest.mark.skipif(not PYFOLIO_AVAILABLE, reason="pyfolio not available")
     @patch('src.meqsap.reporting.pf.create_full_tear_sheet')
     @patch('src.meqsap.reporting.plt')
@@ -720,6 +805,49 @@ class TestPyfolioIntegration:
             mock_fig.savefig.assert_called_once_with(output_path, format='pdf', bbox_inches='tight', dpi=300)
             mock_plt.close.assert_called_once_with(mock_fig)
 
+    
+    def test_generate_pdf_report_reuses_cached_pdf(self, tmp_path):
+        """Test an identical tear sheet is copied from the cache instead of re-rendered."""
+        mock_fig = MagicMock()
+        mock_fig.savefig.side_effect = lambda path, **kwargs: Path(path).write_bytes(b"%PDF")
+        analysis_result = MagicMock(primary_result=self.create_sample_backtest_result_with_series())
+        
+        with patch('src.meqsap.reporting.format_utils.PYFOLIO_AVAILABLE', True), \
+             patch('src.meqsap.reporting.format_utils.PDF_CACHE_DIR', tmp_path / "cache"), \
+             patch('src.meqsap.reporting.format_utils.plt'), \
+             patch('src.meqsap.reporting.format_utils.pf') as mock_pf:
+            mock_pf.create_full_tear_sheet.return_value = mock_fig
+            
+            generate_pdf_report(analysis_result, tmp_path / "first.pdf")
+            generate_pdf_report(analysis_result, tmp_path / "second.pdf")
+            assert mock_pf.create_full_tear_sheet.call_count == 1
+            assert (tmp_path / "second.pdf").read_bytes() == b"%PDF"
+            
+            generate_pdf_report(analysis_result, tmp_path / "third.pdf", force=True)
+            assert mock_pf.create_full_tear_sheet.call_count == 2
+    
+    def test_pdf_cache_key_covers_renderer_and_layout(self):
+        """Test a renderer upgrade or layout change does not reuse older cached PDFs."""
+        from src.meqsap.reporting.format_utils import _pdf_cache_key
+        returns = pd.Series([0.01, -0.02], index=pd.to_datetime(["2023-01-02", "2023-01-03"]))
+        key = _pdf_cache_key(returns)
+        
+        with patch('src.meqsap.reporting.format_utils._pdf_renderer_versions', return_value="0.0/0.0"):
+            assert _pdf_cache_key(returns) != key
+        with patch('src.meqsap.reporting.format_utils.PDF_LAYOUT_VERSION', 0):
+            assert _pdf_cache_key(returns) != key
+    
+    def test_generate_pdf_report_broken_pyfolio_install(self, tmp_path):
+        """Test an installed pyfolio that fails to import reports the missing dependency."""
+        analysis_result = MagicMock(primary_result=self.create_sample_backtest_result_with_series())
+        
+        with patch('src.meqsap.reporting.format_utils.PYFOLIO_AVAILABLE', True), \
+             patch('src.meqsap.reporting.format_utils.PDF_CACHE_DIR', tmp_path / "cache"), \
+             patch('src.meqsap.reporting.format_utils.pf', None), \
+             patch.dict('sys.modules', {'pyfolio': None}):
+            with pytest.raises(ReportingError, match="PDF report generation requires pyfolio"):
+                generate_pdf_report(analysis_result, tmp_path / "report.pdf")
+
 
 class TestCompleteReportGeneration:
     """Test complete report generation workflow."""
@@ -794,6 +922,16 @@ class TestCompleteReportGeneration:
         # Should not generate terminal output in quiet mode
         mock_generate_verdict.assert_not_called()
     
+    @patch('src.meqsap.reporting.main.ComparativeAnalysisResult')
+    @patch('src.meqsap.reporting.main.ReportingOrchestrator')
+    def test_generate_complete_report_nothing_to_do(self, mock_orchestrator, mock_result):
+        """Test quiet mode without PDF returns before building anything."""
+        result = generate_complete_report(self.create_sample_analysis_result(), include_pdf=False, quiet=True)
+        
+        assert result is None
+        mock_orchestrator.assert_not_called()
+        mock_result.assert_not_called()
+    
     @patch('src.meqsap.reporting.reporters.TerminalReporter.generate_report')
     @patch('src.meqsap.reporting.reporters.generate_pdf_report')
     def test_generate_complete_report_with_pdf(self, mock_pdf_gen, mock_terminal_report):
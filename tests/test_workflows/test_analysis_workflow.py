@@ -70,14 +70,18 @@ class TestAnalysisWorkflow:
         mock_config.get_baseline_config_with_defaults.return_value = baseline_config
         candidate_result = mock_backtest_analysis_result_factory(sharpe_ratio=1.5)
         baseline_result = mock_backtest_analysis_result_factory(sharpe_ratio=1.0)
-        mock_run_backtest.side_effect = [candidate_result, baseline_result]
+        # Candidate and baseline run concurrently, so route results by config rather than call order
+        mock_run_backtest.side_effect = lambda config, data: candidate_result if config is mock_config else baseline_result
         mock_fetch_data.return_value = mock_market_data
 
         workflow = AnalysisWorkflow(mock_config, cli_flags)
-        workflow.execute()
+        result = workflow.execute()
 
         mock_fetch_data.assert_called_once()
         assert mock_run_backtest.call_count == 2
+        assert result.candidate_result is candidate_result
+        assert result.baseline_result is baseline_result
+        assert result.comparative_verdict == "Outperformed"
         mock_orchestrator_cls.return_value.add_reporter.assert_called()
 
     @patch('src.meqsap.workflows.analysis.fetch_market_data')
@@ -88,7 +92,11 @@ class TestAnalysisWorkflow:
         baseline_config = BaselineConfig(strategy_type="BuyAndHold", active=True)
         mock_config.get_baseline_config_with_defaults.return_value = baseline_config
         candidate_result = mock_backtest_analysis_result_factory()
-        mock_run_backtest.side_effect = [candidate_result, BacktestError("Baseline failed")]
+        def run_backtest(config, data):
+            if config is mock_config:
+                return candidate_result
+            raise BacktestError("Baseline failed")
+        mock_run_backtest.side_effect = run_backtest
         mock_fetch_data.return_value = mock_market_data
 
         workflow = AnalysisWorkflow(mock_config, cli_flags)
@@ -111,3 +119,23 @@ class TestAnalysisWorkflow:
         
         with pytest.raises(BacktestError, match="Candidate strategy backtest failed"):
             workflow.execute()
+
+    def test_create_baseline_strategy_config(self, mock_cli_flags):
+        config = StrategyConfig(
+            ticker="AAPL",
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            strategy_type="MovingAverageCrossover",
+            strategy_params={"fast_ma": 10, "slow_ma": 30},
+            baseline_config=BaselineConfig(strategy_type="BuyAndHold"),
+        )
+        workflow = AnalysisWorkflow(config, mock_cli_flags)
+
+        baseline = workflow._create_baseline_strategy_config(config.baseline_config)
+
+        assert isinstance(baseline, StrategyConfig)
+        assert baseline.strategy_type == "BuyAndHold"
+        assert baseline.strategy_params == {}
+        assert baseline.baseline_config is None
+        assert (baseline.ticker, baseline.start_date, baseline.end_date) == ("AAPL", date(2023, 1, 1), date(2023, 12, 31))
+        assert config.strategy_type == "MovingAverageCrossover"